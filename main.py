@@ -1,2345 +1,2838 @@
-import os
-import asyncio
-import logging
-from dotenv import load_dotenv
-from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters, ConversationHandler
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import json
-import re
-import time
-import requests
-from math import radians, cos, sin, asin, sqrt
-# import googlemaps  # Removed - using OSRM API instead
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
-import threading
-
-# Load environment variables
-# Get the directory where this script is located
-script_dir = os.path.dirname(os.path.abspath(__file__))
-env_file = os.path.join(script_dir, '.env')
-load_dotenv(env_file)
-
-# Configure logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
-logger = logging.getLogger(__name__)
-
-# Conversation states for driver management
-ADD_DRIVER_NAME, ADD_DRIVER_UNIT, ADD_DRIVER_URL = range(3)
-
-class LocationBot:
-    def __init__(self):
-        self.bot_token = os.getenv('BOT_TOKEN')
-        self.authorized_users = [int(user_id) for user_id in os.getenv('AUTHORIZED_USERS', '').split(',') if user_id.strip()]
-        self.eld_url = os.getenv('ELD_URL')
-        # Load drivers configuration from JSON file
-        # Use the script directory that was already determined
-        self.drivers_config_file = os.path.join(script_dir, 'drivers_config.json')
-        self.drivers_config = self.load_drivers_config()
-        
-        # Create a mapping from chat_id to driver info for quick lookup
-        self.chat_to_driver = {}
-        for driver in self.drivers_config.get('drivers', []):
-            if driver.get('telegram_group_id'):
-                self.chat_to_driver[str(driver['telegram_group_id'])] = driver
-                logger.info(f"✅ Loaded driver mapping: Chat {driver['telegram_group_id']} -> {driver['name']} (Unit: {driver['unit_number']})")
-        
-        logger.info(f"📊 Total driver mappings loaded: {len(self.chat_to_driver)}")
-        
-        # Performance optimizations
-        self.cache = {}
-        self.cache_lock = threading.Lock()
-        self.cache_duration = 15  # Reduce cache duration to 15 seconds for fresher data
-        self.executor = ThreadPoolExecutor(max_workers=15)  # Increase workers for better concurrency with multiple groups
-        self.selenium_semaphore = threading.Semaphore(8)  # Limit concurrent Selenium instances to prevent resource exhaustion
-        
-        # Auto-update settings
-        self.auto_update_interval = 7200  # 2 hours for automatic updates
-        self.application = None
-        
-        # Store destination addresses and individual timers for each group
-        self.group_destinations = {}  # {chat_id: destination_address}
-        self.group_update_tasks = {}  # {chat_id: asyncio.Task} - individual timer tasks for each group
-        
-        # Track driver stop times for extended stop alerts
-        self.driver_stop_times = {}  # {driver_url: {'stopped_since': datetime, 'location': str, 'notified': bool}}
-        self.extended_stop_threshold = 45 * 60  # 45 minutes in seconds
-        
-        # Geocoding cache to prevent inconsistent coordinates
-        self.geocoding_cache = {}  # {address: (lat, lon, timestamp)}
-        self.geocoding_cache_duration = 3600  # 1 hour cache for addresses
-        
-        # Distance validation to prevent incorrect calculations
-        self.distance_cache = {}  # {(chat_id, destination): {'distance': float, 'timestamp': datetime, 'driver_location': str}}
-        self.distance_cache_duration = 60  # 1 minute cache for distance calculations
-        
-        
-        if not self.bot_token:
-            raise ValueError("BOT_TOKEN not found in environment variables")
-        
-        # ELD_URL is not needed if drivers_config.json has driver configurations
-        if not self.eld_url and not self.drivers_config.get('drivers'):
-            raise ValueError("ELD_URL or drivers_config.json with driver configurations not found")
-        
-        # Using OSRM API + OpenStreetMap for all distance calculations and geocoding
-        logger.info("✅ Using OSRM API + OpenStreetMap for distance calculations and geocoding")
-    
-    def osrm_distance(self, origin_lat, origin_lon, dest_lat, dest_lon):
-        """Calculate driving distance and time using OSRM public API"""
-        try:
-            logger.info(f"Calculating OSRM distance from ({origin_lat}, {origin_lon}) to ({dest_lat}, {dest_lon})")
-            
-            # Build OSRM API URL
-            osrm_url = f"http://router.project-osrm.org/route/v1/driving/{origin_lon},{origin_lat};{dest_lon},{dest_lat}?overview=false"
-            headers = {'User-Agent': 'TelegramBot/1.0'}
-            
-            # Request OSRM API
-            response = requests.get(osrm_url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data['routes']:
-                    distance_meters = data['routes'][0]['distance']
-                    duration_seconds = data['routes'][0]['duration']
-                    
-                    # OSRM always returns distance in meters, convert to miles
-                    distance_miles = distance_meters * 0.000621371
-                    # Convert seconds to minutes and hours
-                    duration_minutes = duration_seconds / 60
-                    duration_hours = duration_minutes / 60
-                    
-                    # Format duration text based on hours
-                    if duration_hours >= 1:
-                        duration_text = f"{duration_hours:.1f} hr"
-                    else:
-                        duration_text = f"{duration_minutes:.0f} min"
-                    
-                    logger.info(f"OSRM distance calculated: {distance_miles:.2f} miles, {duration_hours:.1f} hours")
-                    return {
-                        'distance_miles': distance_miles,
-                        'distance_text': f"{distance_miles:.1f} mi",
-                        'duration_text': duration_text,
-                        'duration_minutes': duration_minutes,
-                        'duration_hours': duration_hours,
-                        'method': 'OSRM API'
-                    }
-                else:
-                    logger.warning("OSRM returned no routes")
-            else:
-                logger.error(f"OSRM API returned status code: {response.status_code}")
-            return None
-        except Exception as e:
-            logger.error(f"OSRM distance calculation error: {e}")
-            return None
-
-    
-    def is_authorized(self, user_id: int) -> bool:
-        """Check if user is authorized to use the bot"""
-        # Allow everyone to use the bot
-        return True
-    
-    def haversine_distance(self, lat1, lon1, lat2, lon2):
-        """Calculate distance between two points using Haversine formula"""
-        try:
-            logger.info(f"Calculating haversine distance between ({lat1}, {lon1}) and ({lat2}, {lon2})")
-            
-            # Validate inputs
-            if not all(isinstance(x, (int, float)) for x in [lat1, lon1, lat2, lon2]):
-                logger.error("Invalid coordinate types")
-                return None
-            
-            # Convert to radians
-            lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-            
-            # Haversine formula
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-            c = 2 * asin(sqrt(a))
-            
-            # Radius of earth in miles
-            r = 3959
-            
-            distance = c * r
-            # Estimated duration (assuming average speed)
-            avg_speed_mph = 60  # Assuming a default average speed
-            duration_minutes = (distance / avg_speed_mph) * 60
-            duration_hours = duration_minutes / 60
-            logger.info(f"Haversine distance calculated: {distance:.2f} miles, duration: {duration_hours:.1f} hours")
-            return {
-                'distance_miles': distance,
-                'duration_minutes': duration_minutes,
-                'duration_hours': duration_hours
-            }
-        except Exception as e:
-            logger.error(f"Haversine distance calculation error: {e}")
-            return None
-    
-    def parse_and_clean_address(self, address):
-        """Parse and clean address for better geocoding success"""
-        try:
-            import re
-            
-            # Remove extra whitespace and convert to title case
-            address = ' '.join(address.split())
-            
-            # Common address variations to try
-            variations = []
-            
-            # Original address
-            variations.append(address)
-            
-            # Remove business names at the beginning
-            business_removed = re.sub(r'^[A-Z\s]+\s+(?=\d)', '', address)
-            if business_removed != address:
-                variations.append(business_removed.strip())
-            
-            # Try with different route formats
-            # Convert "US-9" to "Route 9" or "US Route 9"
-            us_route_match = re.search(r'US-?(\d+)', address, re.IGNORECASE)
-            if us_route_match:
-                route_num = us_route_match.group(1)
-                variations.append(address.replace(us_route_match.group(0), f"Route {route_num}"))
-                variations.append(address.replace(us_route_match.group(0), f"US Route {route_num}"))
-                variations.append(address.replace(us_route_match.group(0), f"Highway {route_num}"))
-            
-            # Try with "RTE" converted to "Route"
-            if 'RTE' in address.upper():
-                variations.append(re.sub(r'RTE\s*(\d+)', r'Route \1', address, flags=re.IGNORECASE))
-                variations.append(re.sub(r'RTE\s*(\d+)', r'Highway \1', address, flags=re.IGNORECASE))
-            
-            # Try without specific building/business names
-            # Remove words like "HANNAFORD", "BROTHERS", etc.
-            simple_address = re.sub(r'^[A-Z\s]+(?=\d)', '', address).strip()
-            if simple_address and simple_address != address:
-                variations.append(simple_address)
-            
-            # Try with just the street number and main components
-            street_match = re.search(r'(\d+)\s+([^,]+),\s*([^,]+),\s*([A-Z]{2})', address)
-            if street_match:
-                number, street, city, state = street_match.groups()
-                variations.append(f"{number} {street}, {city}, {state}")
-                variations.append(f"{street}, {city}, {state}")
-                variations.append(f"{city}, {state}")
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_variations = []
-            for var in variations:
-                if var and var not in seen:
-                    seen.add(var)
-                    unique_variations.append(var)
-            
-            logger.info(f"Address variations to try: {unique_variations}")
-            return unique_variations
-            
-        except Exception as e:
-            logger.error(f"Error parsing address: {e}")
-            return [address]
-    
-    def get_cached_geocoding(self, address):
-        """Get cached geocoding result if available and valid"""
-        if address in self.geocoding_cache:
-            lat, lon, timestamp = self.geocoding_cache[address]
-            if datetime.now() - timestamp < timedelta(seconds=self.geocoding_cache_duration):
-                logger.info(f"Using cached geocoding for: {address} -> ({lat}, {lon})")
-                return lat, lon
-            else:
-                # Remove expired cache
-                del self.geocoding_cache[address]
-        return None, None
-    
-    def set_geocoding_cache(self, address, lat, lon):
-        """Cache geocoding result"""
-        self.geocoding_cache[address] = (lat, lon, datetime.now())
-        logger.info(f"Cached geocoding for: {address} -> ({lat}, {lon})")
-    
-    def geocode_address(self, address):
-        """Get coordinates from address using multiple strategies and fallbacks"""
-        try:
-            logger.info(f"Geocoding address: {address}")
-            
-            # Check cache first
-            cached_lat, cached_lon = self.get_cached_geocoding(address)
-            if cached_lat is not None and cached_lon is not None:
-                return cached_lat, cached_lon
-            
-            # Get address variations
-            address_variations = self.parse_and_clean_address(address)
-            
-            # Use OpenStreetMap Nominatim for geocoding
-            logger.info("Using OpenStreetMap Nominatim for geocoding")
-            
-            for addr_variant in address_variations:
-                try:
-                    # Try exact search first
-                    url = f"https://nominatim.openstreetmap.org/search?q={addr_variant}&format=json&limit=3&countrycodes=us"
-                    headers = {'User-Agent': 'TelegramBot/1.0'}
-                    
-                    response = requests.get(url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data:
-                            # Take the first result
-                            lat, lon = float(data[0]['lat']), float(data[0]['lon'])
-                            logger.info(f"OpenStreetMap geocoding successful: ({lat}, {lon}) for variant: {addr_variant}")
-                            # Cache the result
-                            self.set_geocoding_cache(address, lat, lon)
-                            return lat, lon
-                except Exception as e:
-                    logger.error(f"OpenStreetMap error for '{addr_variant}': {e}")
-                    continue
-            
-            # Try with structured search if all else fails
-            logger.info("Trying structured search as final fallback")
-            for addr_variant in address_variations:
-                try:
-                    # Try to parse structured components
-                    import re
-                    match = re.search(r'(\d+)\s+([^,]+),\s*([^,]+),\s*([A-Z]{2})', addr_variant)
-                    if match:
-                        number, street, city, state = match.groups()
-                        
-                        # Structured search
-                        structured_url = f"https://nominatim.openstreetmap.org/search?format=json&housenumber={number}&street={street}&city={city}&state={state}&country=us&limit=1"
-                        
-                        response = requests.get(structured_url, headers=headers, timeout=10)
-                        if response.status_code == 200:
-                            data = response.json()
-                            if data:
-                                lat, lon = float(data[0]['lat']), float(data[0]['lon'])
-                                logger.info(f"Structured search successful: ({lat}, {lon}) for: {addr_variant}")
-                                # Cache the result
-                                self.set_geocoding_cache(address, lat, lon)
-                                return lat, lon
-                except Exception as e:
-                    logger.error(f"Structured search error for '{addr_variant}': {e}")
-                    continue
-            
-            # Final fallback - try just city and state
-            logger.info("Trying city/state fallback")
-            for addr_variant in address_variations:
-                try:
-                    import re
-                    match = re.search(r'([^,]+),\s*([A-Z]{2})', addr_variant)
-                    if match:
-                        city, state = match.groups()
-                        city_url = f"https://nominatim.openstreetmap.org/search?q={city}, {state}&format=json&limit=1&countrycodes=us"
-                        
-                        response = requests.get(city_url, headers=headers, timeout=10)
-                        if response.status_code == 200:
-                            data = response.json()
-                            if data:
-                                lat, lon = float(data[0]['lat']), float(data[0]['lon'])
-                                logger.info(f"City/state fallback successful: ({lat}, {lon}) for: {city}, {state}")
-                                # Cache the result
-                                self.set_geocoding_cache(address, lat, lon)
-                                return lat, lon
-                except Exception as e:
-                    logger.error(f"City/state fallback error: {e}")
-                    continue
-            
-            logger.error(f"All geocoding attempts failed for address: {address}")
-            return None, None
-            
-        except Exception as e:
-            logger.error(f"Geocoding error for '{address}': {e}")
-            return None, None
-    
-    def parse_driver_location(self, location_str):
-        """Extract coordinates from driver location string"""
-        try:
-            # For now, we'll use geocoding for the driver location too
-            # In the future, you could extract GPS coordinates directly if available
-            return self.geocode_address(location_str)
-        except:
-            return None, None
-    
-    def is_distance_valid(self, chat_id, destination, new_distance, driver_location):
-        """Validate distance calculation to prevent backtracking issues"""
-        if (chat_id, destination) not in self.distance_cache:
-            # No previous record, so cache it
-            self.distance_cache[(chat_id, destination)] = {
-                'distance': new_distance,
-                'timestamp': datetime.now(),
-                'driver_location': driver_location
-            }
-            logger.info(f"Distance cache set for chat {chat_id} to destination {destination}")
-            return True
-        
-        cached_data = self.distance_cache[(chat_id, destination)]
-        cached_distance = cached_data['distance']
-        cache_time_diff = (datetime.now() - cached_data['timestamp']).total_seconds()
-        # If cache is still valid (1 minute) and new distance is greater, invalidate it
-        if cache_time_diff < self.distance_cache_duration and new_distance > cached_distance:
-            logger.warning(f"Distance validation failed. Cached: {cached_distance}, New: {new_distance}")
-            return False
-        # Update cache
-        self.distance_cache[(chat_id, destination)] = {
-            'distance': new_distance,
-            'timestamp': datetime.now(),
-            'driver_location': driver_location
-        }
-        logger.info(f"Distance cache updated for chat {chat_id} to destination {destination}")
-        return True
-
-    def calculate_distance_and_time(self, origin_address, destination_address, chat_id=None, driver_location=None):
-        """Calculate distance and travel time using OSRM and OpenStreetMap"""
-        try:
-            logger.info(f"Calculating distance from '{origin_address}' to '{destination_address}'")
-            
-            # Clean the addresses
-            origin_address = self.sanitize_address(origin_address)
-            destination_address = self.sanitize_address(destination_address)
-            logger.info(f"Sanitized addresses - Origin: '{origin_address}', Destination: '{destination_address}'")
-            
-            # Use OSRM for driving distance
-            logger.info("Using OSRM API for driving distance calculation")
-            origin_lat, origin_lon = self.geocode_address(origin_address)
-            dest_lat, dest_lon = self.geocode_address(destination_address)
-            
-            if origin_lat is None or dest_lat is None:
-                logger.error("Failed to geocode one or both addresses")
-                if origin_lat is None:
-                    logger.error(f"❌ Could not geocode origin address: '{origin_address}'")
-                if dest_lat is None:
-                    logger.error(f"❌ Could not geocode destination address: '{destination_address}'")
-                return None
-            
-            osrm_result = self.osrm_distance(origin_lat, origin_lon, dest_lat, dest_lon)
-            if osrm_result is not None:
-                # Validate distance value
-                if chat_id is not None and not self.is_distance_valid(chat_id, destination_address, osrm_result['distance_miles'], origin_address):
-                    logger.error("Invalid distance calculation: backtracking or inconsistency detected")
-                    return None
-                return osrm_result
-            
-            # Fallback to haversine calculation
-            logger.info("🔄 Using fallback haversine calculation (straight-line distance)")
-            haversine_result = self.haversine_distance(origin_lat, origin_lon, dest_lat, dest_lon)
-            if haversine_result is None:
-                logger.error("Haversine distance calculation failed")
-                return None
-            
-            distance = haversine_result['distance_miles']
-            duration_minutes = haversine_result['duration_minutes']
-            duration_hours = haversine_result['duration_hours']
-            
-            # Validate distance value
-            if chat_id is not None and not self.is_distance_valid(chat_id, destination_address, distance, origin_address):
-                logger.error("Invalid distance calculation: backtracking or inconsistency detected")
-                return None
-            
-            logger.info(f"✅ Haversine calculation successful: {distance:.1f} miles (straight-line)")
-            
-            # Format duration text based on hours
-            if duration_hours >= 1:
-                duration_text = f"{duration_hours:.1f} hr (estimated)"
-            else:
-                duration_text = f"{duration_minutes:.0f} min (estimated)"
-            
-            # Add note about the calculation method
-            fallback_method = "Haversine (straight-line) - OSRM API unavailable"
-            
-            return {
-                'distance_miles': distance,
-                'distance_text': f"{distance:.1f} mi (straight-line)",
-                'duration_text': duration_text,
-                'duration_minutes': duration_minutes,
-                'duration_hours': duration_hours,
-                'method': fallback_method
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in calculate_distance_and_time: {e}")
-            return None
-
-    def load_drivers_config(self):
-        """Load drivers configuration from JSON file"""
-        try:
-            with open(self.drivers_config_file, 'r') as f:
-                config = json.load(f)
-            logger.info(f"Loaded {len(config.get('drivers', []))} drivers from configuration")
-            return config
-        except FileNotFoundError:
-            logger.warning(f"Drivers config file {self.drivers_config_file} not found. Creating empty config.")
-            return {'drivers': []}
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in {self.drivers_config_file}: {e}")
-            return {'drivers': []}
-        except Exception as e:
-            logger.error(f"Error loading drivers config: {e}")
-            return {'drivers': []}
-
-    def save_drivers_config(self):
-        """Save drivers configuration to JSON file"""
-        try:
-            with open(self.drivers_config_file, 'w') as f:
-                json.dump(self.drivers_config, f, indent=2)
-            logger.info("Drivers configuration saved successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving drivers config: {e}")
-            return False
-    
-    def get_driver_by_chat_id(self, chat_id):
-        """Get driver configuration for a specific chat ID"""
-        return self.chat_to_driver.get(str(chat_id))
-    
-    def get_eld_url_for_group(self, chat_id):
-        """Get the ELD URL for a given Telegram group ID."""
-        # First check if there's a specific driver mapped to this chat
-        driver = self.get_driver_by_chat_id(chat_id)
-        if driver:
-            logger.info(f"🎯 Found driver mapping for chat {chat_id}: {driver['name']} (Unit: {driver['unit_number']})")
-            return driver['eld_url']
-        
-        # Log warning if no driver is assigned to this group
-        logger.warning(f"⚠️ No driver assigned to chat {chat_id}. Use /setdriver [driver_name] to assign a driver.")
-        
-        # Return None instead of default ELD_URL to force proper assignment
-        return None
-    
-    def set_driver_for_group(self, chat_id, driver_name):
-        """Set which driver to track for a specific group"""
-        # Find the driver by name
-        driver = None
-        for d in self.drivers_config.get('drivers', []):
-            if d['name'].lower() == driver_name.lower():
-                driver = d
-                break
-        
-        if not driver:
-            return False, f"Driver '{driver_name}' not found in configuration"
-        
-        # Check if this driver is already assigned to another group
-        if driver.get('telegram_group_id') and driver['telegram_group_id'] != chat_id:
-            old_chat_id = driver['telegram_group_id']
-            logger.info(f"🔄 Driver {driver['name']} reassigned from chat {old_chat_id} to chat {chat_id}")
-            # Remove old mapping
-            if str(old_chat_id) in self.chat_to_driver:
-                del self.chat_to_driver[str(old_chat_id)]
-        
-        # Check if this group already has a different driver assigned
-        if str(chat_id) in self.chat_to_driver:
-            old_driver = self.chat_to_driver[str(chat_id)]
-            if old_driver['name'] != driver['name']:
-                # Clear the old driver's assignment
-                old_driver['telegram_group_id'] = None
-                logger.info(f"🔄 Group {chat_id} reassigned from driver {old_driver['name']} to {driver['name']}")
-        
-        # Update the driver's telegram_group_id
-        driver['telegram_group_id'] = chat_id
-        
-        # Update the chat_to_driver mapping
-        self.chat_to_driver[str(chat_id)] = driver
-        
-        # Save the configuration
-        if self.save_drivers_config():
-            logger.info(f"✅ Successfully linked chat {chat_id} to driver {driver['name']} (Unit: {driver['unit_number']})")
-            return True, f"Group linked to driver {driver['name']} (Unit: {driver['unit_number']})"
-        else:
-            return False, "Failed to save configuration"
-    
-    def list_available_drivers(self):
-        """Get a list of all available drivers"""
-        drivers = []
-        for driver in self.drivers_config.get('drivers', []):
-            drivers.append({
-                'name': driver['name'],
-                'unit_number': driver['unit_number'],
-                'assigned_group': driver.get('telegram_group_id', None)
-            })
-        return drivers
-    
-    def add_new_driver(self, name, unit_number, eld_url):
-        """Add a new driver to the configuration"""
-        try:
-            # Check if driver with this name already exists
-            for driver in self.drivers_config.get('drivers', []):
-                if driver['name'].lower() == name.lower():
-                    return False, f"Driver '{name}' already exists"
-            
-            # Check if unit number already exists
-            for driver in self.drivers_config.get('drivers', []):
-                if driver['unit_number'].lower() == unit_number.lower():
-                    return False, f"Unit number '{unit_number}' is already taken"
-            
-            # Validate ELD URL format
-            if not eld_url.startswith('https://state-eld.us/shared-driver-link/'):
-                return False, "Invalid ELD URL format. Must start with 'https://state-eld.us/shared-driver-link/'"
-            
-            # Add new driver
-            new_driver = {
-                'name': name,
-                'unit_number': unit_number,
-                'eld_url': eld_url,
-                'telegram_group_id': None
-            }
-            
-            if 'drivers' not in self.drivers_config:
-                self.drivers_config['drivers'] = []
-            
-            self.drivers_config['drivers'].append(new_driver)
-            
-            # Save configuration
-            if self.save_drivers_config():
-                logger.info(f"✅ Added new driver: {name} (Unit: {unit_number})")
-                return True, f"Driver '{name}' (Unit: {unit_number}) added successfully"
-            else:
-                # Remove from memory if save failed
-                self.drivers_config['drivers'].pop()
-                return False, "Failed to save configuration"
-                
-        except Exception as e:
-            logger.error(f"Error adding driver: {e}")
-            return False, f"Error adding driver: {str(e)}"
-    
-    def remove_driver(self, driver_name):
-        """Remove a driver from the configuration"""
-        try:
-            # Find the driver
-            driver_index = None
-            driver_to_remove = None
-            for i, driver in enumerate(self.drivers_config.get('drivers', [])):
-                if driver['name'].lower() == driver_name.lower():
-                    driver_index = i
-                    driver_to_remove = driver
-                    break
-            
-            if driver_index is None:
-                return False, f"Driver '{driver_name}' not found"
-            
-            # Remove from chat mapping if assigned
-            if driver_to_remove.get('telegram_group_id'):
-                chat_id = str(driver_to_remove['telegram_group_id'])
-                if chat_id in self.chat_to_driver:
-                    del self.chat_to_driver[chat_id]
-                    logger.info(f"Removed driver mapping for chat {chat_id}")
-            
-            # Remove from configuration
-            removed_driver = self.drivers_config['drivers'].pop(driver_index)
-            
-            # Save configuration
-            if self.save_drivers_config():
-                logger.info(f"✅ Removed driver: {removed_driver['name']} (Unit: {removed_driver['unit_number']})")
-                return True, f"Driver '{removed_driver['name']}' removed successfully"
-            else:
-                # Restore if save failed
-                self.drivers_config['drivers'].insert(driver_index, removed_driver)
-                return False, "Failed to save configuration"
-                
-        except Exception as e:
-            logger.error(f"Error removing driver: {e}")
-            return False, f"Error removing driver: {str(e)}"
-    
-    def edit_driver(self, driver_name, field, new_value):
-        """Edit a driver's information"""
-        try:
-            # Find the driver
-            driver = None
-            for d in self.drivers_config.get('drivers', []):
-                if d['name'].lower() == driver_name.lower():
-                    driver = d
-                    break
-            
-            if not driver:
-                return False, f"Driver '{driver_name}' not found"
-            
-            old_value = driver.get(field, 'N/A')
-            
-            # Validate field and value
-            if field == 'name':
-                # Check if new name conflicts with existing drivers
-                for d in self.drivers_config.get('drivers', []):
-                    if d != driver and d['name'].lower() == new_value.lower():
-                        return False, f"Driver name '{new_value}' already exists"
-                driver['name'] = new_value
-            elif field == 'unit_number':
-                # Check if new unit number conflicts
-                for d in self.drivers_config.get('drivers', []):
-                    if d != driver and d['unit_number'].lower() == new_value.lower():
-                        return False, f"Unit number '{new_value}' is already taken"
-                driver['unit_number'] = new_value
-            elif field == 'eld_url':
-                if not new_value.startswith('https://state-eld.us/shared-driver-link/'):
-                    return False, "Invalid ELD URL format. Must start with 'https://state-eld.us/shared-driver-link/'"
-                driver['eld_url'] = new_value
-            else:
-                return False, f"Invalid field '{field}'. Valid fields: name, unit_number, eld_url"
-            
-            # Update chat mapping if driver name changed
-            if field == 'name' and driver.get('telegram_group_id'):
-                chat_id = str(driver['telegram_group_id'])
-                if chat_id in self.chat_to_driver:
-                    self.chat_to_driver[chat_id] = driver
-            
-            # Save configuration
-            if self.save_drivers_config():
-                logger.info(f"✅ Updated driver {driver_name}: {field} changed from '{old_value}' to '{new_value}'")
-                return True, f"Driver {field} updated from '{old_value}' to '{new_value}'"
-            else:
-                # Restore old value if save failed
-                driver[field] = old_value
-                return False, "Failed to save configuration"
-                
-        except Exception as e:
-            logger.error(f"Error editing driver: {e}")
-            return False, f"Error editing driver: {str(e)}"
-    
-    def get_driver_info(self, driver_name):
-        """Get detailed information about a driver"""
-        for driver in self.drivers_config.get('drivers', []):
-            if driver['name'].lower() == driver_name.lower():
-                return driver
-        return None
-    
-    def get_cached_data(self, cache_key):
-        """Get cached data if it's still valid"""
-        with self.cache_lock:
-            if cache_key in self.cache:
-                data, timestamp = self.cache[cache_key]
-                if datetime.now() - timestamp < timedelta(seconds=self.cache_duration):
-                    logger.info(f"Cache hit for {cache_key}")
-                    return data
-                else:
-                    # Remove expired cache
-                    del self.cache[cache_key]
-        return None
-    
-    def set_cached_data(self, cache_key, data):
-        """Set cached data with timestamp"""
-        with self.cache_lock:
-            self.cache[cache_key] = (data, datetime.now())
-            logger.info(f"Cache set for {cache_key}")
-    
-    def get_driver_status(self, driver_data):
-        """Determine driver status based on speed"""
-        try:
-            # Extract speed value from speed string (e.g., "65.2 mph" -> 65.2)
-            speed_str = driver_data.get('speed', '0 mph')
-            speed_value = float(speed_str.replace(' mph', '').replace(',', ''))
-            
-            if speed_value > 0:
-                return "🚗 Driving", speed_value
-            else:
-                return "🛑 Stopped", speed_value
-        except (ValueError, AttributeError):
-            return "❓ Unknown", 0
-    
-    def track_driver_stop_time(self, eld_url, driver_data):
-        """Track how long a driver has been stopped"""
-        try:
-            status, speed = self.get_driver_status(driver_data)
-            current_time = datetime.now()
-            current_location = driver_data.get('location', 'Unknown')
-            
-            if speed == 0:  # Driver is stopped
-                if eld_url not in self.driver_stop_times:
-                    # First time we see this driver stopped
-                    self.driver_stop_times[eld_url] = {
-                        'stopped_since': current_time,
-                        'location': current_location,
-                        'notified': False
-                    }
-                    logger.info(f"Driver started stopping at {current_time}")
-                else:
-                    # Update location but keep the original stop time
-                    self.driver_stop_times[eld_url]['location'] = current_location
-            else:  # Driver is moving
-                if eld_url in self.driver_stop_times:
-                    # Driver started moving again, clear the stop time
-                    del self.driver_stop_times[eld_url]
-                    logger.info(f"Driver started moving again")
-            
-            return self.driver_stop_times.get(eld_url)
-        except Exception as e:
-            logger.error(f"Error tracking driver stop time: {e}")
-            return None
-    
-    def check_extended_stop(self, eld_url):
-        """Check if driver has been stopped for more than 45 minutes"""
-        if eld_url not in self.driver_stop_times:
-            return False, None
-        
-        stop_info = self.driver_stop_times[eld_url]
-        current_time = datetime.now()
-        stop_duration = (current_time - stop_info['stopped_since']).total_seconds()
-        
-        if stop_duration >= self.extended_stop_threshold and not stop_info['notified']:
-            # Mark as notified to avoid spam
-            stop_info['notified'] = True
-            stop_duration_minutes = int(stop_duration // 60)
-            return True, stop_duration_minutes
-        
-        return False, None
-    
-    def extract_driver_data_ultra_fast(self, eld_url):
-        """Fast extraction using optimized Selenium with concurrency control"""
-        # This page is a React app that loads content via JavaScript
-        # So we need to use Selenium, but with optimized patterns and concurrency control
-        with self.selenium_semaphore:
-            return self.extract_driver_data_fast(eld_url)
-    
-    def extract_driver_data_fast(self, eld_url):
-        """Fast extraction with minimal Chrome options"""
-        try:
-            # Simple Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--disable-logging')
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--window-size=1280,720')
-            
-            # Initialize driver with simple configuration
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(15)
-            driver.implicitly_wait(3)
-            
-            try:
-                # Navigate to ELD page
-                driver.get(eld_url)
-                
-                # Wait for React app to load
-                time.sleep(5)
-                
-                # Use WebDriverWait to ensure content is loaded
-                try:
-                    WebDriverWait(driver, 10).until(
-                        lambda d: d.execute_script("return document.body.innerText.includes('Name')")
-                    )
-                except:
-                    # Additional wait if needed
-                    time.sleep(2)
-                
-                # Get page text
-                page_text = driver.execute_script("return document.body.innerText;")
-                
-                # Initialize driver data
-                driver_data = {
-                    'name': 'N/A',
-                    'speed': 'N/A',
-                    'location': 'N/A',
-                    'truck_number': 'N/A'
-                }
-                
-                # Fast regex extraction
-                # Extract speed - handle multiple patterns including N/A
-                speed_patterns = [
-                    r'Speed\s*\n\s*\n\s*([\d\.]+)\s*mph',  # "0 mph" format
-                    r'Speed\s*\n\s*\n\s*(N/A)',  # "N/A" format
-                    r'([\d\.]+)\s*mph'  # Any number followed by mph
-                ]
-                
-                for pattern in speed_patterns:
-                    speed_match = re.search(pattern, page_text, re.IGNORECASE)
-                    if speed_match:
-                        if speed_match.group(1).upper() == 'N/A':
-                            driver_data['speed'] = 'N/A'
-                        else:
-                            speed_val = float(speed_match.group(1))
-                            driver_data['speed'] = f"{speed_val:.1f} mph"
-                        break
-                
-                # Extract name - handle empty data
-                name_patterns = [
-                    r'Name\s*\n\s*\n\s*([A-Za-z\s]+?)\s*\n\s*\n\s*Truck Number',
-                    r'Name\s+([A-Za-z\s]+?)\s+Truck Number',
-                    r'Name\s*\n\s*\n\s*([^\n]+?)\s*\n\s*\n\s*Truck Number'
-                ]
-                
-                for pattern in name_patterns:
-                    name_match = re.search(pattern, page_text, re.IGNORECASE)
-                    if name_match:
-                        name_text = name_match.group(1).strip()
-                        if name_text and len(name_text) > 0:
-                            driver_data['name'] = name_text
-                        else:
-                            driver_data['name'] = 'No driver name available'
-                        break
-                
-                # Extract location - handle "Open in Google Maps" case
-                location_patterns = [
-                    r'Current Location\s*\n\s*\n\s*([^\n]+)',
-                    r'Current Location\s+([^\n]+)',
-                    r'Current Location\s*\n\s*\n\s*([^\n\r]+)'
-                ]
-                
-                for pattern in location_patterns:
-                    location_match = re.search(pattern, page_text, re.IGNORECASE)
-                    if location_match:
-                        location_text = location_match.group(1).strip()
-                        # Check if it's just "Open in Google Maps" (no real location)
-                        if 'Open in Google Maps' in location_text or location_text.lower() in ['n/a', 'not available', 'offline']:
-                            driver_data['location'] = 'Location not available (driver may be offline)'
-                        else:
-                            driver_data['location'] = location_text
-                        break
-                
-                # Extract truck number
-                truck_patterns = [
-                    r'Truck Number\s*\n\s*\n\s*([^\n]+)',
-                    r'Truck Number\s+([^\n]+)',
-                    r'Truck Number\s*\n\s*\n\s*([\w\-]+)'
-                ]
-                
-                for pattern in truck_patterns:
-                    truck_match = re.search(pattern, page_text, re.IGNORECASE)
-                    if truck_match:
-                        truck_text = truck_match.group(1).strip()
-                        if truck_text and len(truck_text) > 0:
-                            driver_data['truck_number'] = truck_text
-                        break
-                
-                # Log the extracted data for debugging
-                logger.info(f"Extracted driver data: {driver_data}")
-                
-                return driver_data
-                
-            finally:
-                driver.quit()
-                
-        except Exception as e:
-            logger.error(f"Error in extract_driver_data_fast: {e}")
-            return {
-                'name': 'Error',
-                'speed': 'Error',
-                'location': 'Error extracting data'
-            }
-
-    def extract_driver_data(self, eld_url):
-        """Extract driver data from ELD page using Selenium"""
-        try:
-            # Setup Chrome options for maximum speed while keeping functionality
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--disable-images')
-            chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-web-security')
-            chrome_options.add_argument('--disable-features=TranslateUI')
-            chrome_options.add_argument('--disable-logging')
-            chrome_options.add_argument('--disable-default-apps')
-            chrome_options.add_argument('--no-first-run')
-            chrome_options.add_argument('--no-default-browser-check')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument('--window-size=1280,720')
-            
-            # Initialize driver with timeouts
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(8)  # 8 second timeout
-            driver.implicitly_wait(3)  # Add implicit wait
-            
-            try:
-                # Navigate to ELD page
-                driver.get(eld_url)
-                
-                # Use WebDriverWait for better performance
-                try:
-                    WebDriverWait(driver, 5).until(
-                        lambda d: d.execute_script("return document.readyState") == "complete"
-                    )
-                except:
-                    pass  # Continue if timeout
-                
-                # Initialize driver data
-                driver_data = {
-                    'name': 'N/A',
-                    'speed': 'N/A',
-                    'location': 'N/A'
-                }
-                
-                # Try to extract data using various methods
-                page_source = driver.page_source
-                
-                # Try to find elements by common selectors
-                name_selectors = [
-                    '[data-testid="driver-name"]',
-                    '.driver-name',
-                    '#driver-name',
-                    '.name',
-                    '#name'
-                ]
-                
-                for selector in name_selectors:
-                    try:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if element and element.text:
-                            driver_data['name'] = element.text.strip()
-                            break
-                    except:
-                        continue
-                
-                # Try to find speed
-                speed_selectors = [
-                    '[data-testid="speed"]',
-                    '.speed',
-                    '#speed',
-                    '.velocity',
-                    '#velocity'
-                ]
-                
-                for selector in speed_selectors:
-                    try:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if element and element.text:
-                            speed_text = element.text.strip()
-                            speed_match = re.search(r'(\d+\.?\d*)\s*mph', speed_text, re.IGNORECASE)
-                            if speed_match:
-                                driver_data['speed'] = f"{speed_match.group(1)} mph"
-                                break
-                    except:
-                        continue
-                
-                # Try to find location
-                location_selectors = [
-                    '[data-testid="location"]',
-                    '.location',
-                    '#location',
-                    '.address',
-                    '#address'
-                ]
-                
-                for selector in location_selectors:
-                    try:
-                        element = driver.find_element(By.CSS_SELECTOR, selector)
-                        if element and element.text:
-                            driver_data['location'] = element.text.strip()
-                            break
-                    except:
-                        continue
-                
-                # Reduced wait time for dynamic content
-                time.sleep(1)
-                
-                # Get page text directly using Python (much faster)
-                try:
-                    page_text = driver.execute_script("return document.body.innerText;")
-                    
-                    # Extract speed using Python regex (handle both integer and decimal)
-                    if driver_data['speed'] == 'N/A':
-                        speed_match = re.search(r'(\d+\.?\d*)\s*mph', page_text, re.IGNORECASE)
-                        if speed_match:
-                            speed_val = float(speed_match.group(1))
-                            driver_data['speed'] = f"{speed_val:.1f} mph"
-                    
-                    # Extract name (between 'Name' and 'Truck Number')
-                    if driver_data['name'] == 'N/A':
-                        name_match = re.search(r'Name\s*\n\s*\n\s*([A-Za-z\s]+?)\s*\n\s*\n\s*Truck Number', page_text, re.IGNORECASE)
-                        if name_match:
-                            driver_data['name'] = name_match.group(1).strip()
-                    
-                    # Extract location (after 'Current Location')
-                    if driver_data['location'] == 'N/A':
-                        location_match = re.search(r'Current Location\s*\n\s*\n\s*([^\n]+)', page_text, re.IGNORECASE)
-                        if location_match:
-                            driver_data['location'] = location_match.group(1).strip()
-                    
-                except Exception as e:
-                    logger.error(f"Fast extraction failed: {e}")
-                
-                # Fallback: try simple text extraction if JavaScript failed
-                if driver_data['name'] == 'N/A' or driver_data['speed'] == 'N/A' or driver_data['location'] == 'N/A':
-                    try:
-                        page_text = driver.execute_script("return document.body.innerText;")
-                        
-                        # Simple fallback patterns
-                        if driver_data['name'] == 'N/A':
-                            name_match = re.search(r'Name\s*\n\s*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', page_text, re.IGNORECASE)
-                            if name_match:
-                                driver_data['name'] = name_match.group(1).strip()
-                        
-                        if driver_data['speed'] == 'N/A':
-                            speed_match = re.search(r'(\d+\.\d+)\s*mph', page_text, re.IGNORECASE)
-                            if speed_match:
-                                speed_val = float(speed_match.group(1))
-                                driver_data['speed'] = f"{speed_val:.1f} mph"
-                        
-                        if driver_data['location'] == 'N/A':
-                            location_match = re.search(r'Current Location\s*\n\s*\n\s*([^\n]+)', page_text, re.IGNORECASE)
-                            if location_match:
-                                driver_data['location'] = location_match.group(1).strip()
-                    
-                    except Exception as e:
-                        logger.error(f"Fallback extraction failed: {e}")
-                
-                return driver_data
-                
-            finally:
-                driver.quit()
-                
-        except Exception as e:
-            logger.error(f"Error in extract_driver_data: {e}")
-            return {
-                'name': 'Error',
-                'speed': 'Error',
-                'location': 'Error extracting data'
-            }
-    
-    def sanitize_address(self, address):
-        """Clean and sanitize address for geocoding"""
-        if not address or address.strip() == '':
-            return ''
-        
-        # Remove trailing non-alphabetic characters and excessive whitespace
-        address = address.strip()
-        # Fix the regex pattern - remove double backslashes
-        address = re.sub(r'[^a-zA-Z0-9,\s]+$', '', address)
-        address = re.sub(r'\s+', ' ', address)
-        
-        # Remove common problematic phrases
-        address = re.sub(r'\bOpen in Google Maps\b', '', address, flags=re.IGNORECASE)
-        address = re.sub(r'\bLocation not available\b', '', address, flags=re.IGNORECASE)
-        address = address.strip()
-        
-        logger.info(f"Sanitized address: '{address}'")
-        return address
-    
-    def shorten_location(self, location):
-        """Shorten location to extract county, state, and zip code in the format: County, State, ZIP"""
-        if not location or location == 'N/A':
-            return location
-        
-        try:
-            import re
-            
-            # Patterns to extract county, state, and zip from full address
-            # Example: "3292, Rennie Smith Drive, South Chicago Heights, Bloom Township, Cook County, Illinois, 60411, United States"
-            # Expected output: "Cook County, Illinois, 60411"
-            
-            patterns = [
-                # Pattern 1: Full address with county - "..., County Name, State, ZIP, Country"
-                r'.*,\s*([^,]*County[^,]*),\s*([A-Z]{2}|[A-Za-z]+),\s*(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
-                # Pattern 2: Full address with county - "..., County Name, State ZIP, Country"
-                r'.*,\s*([^,]*County[^,]*),\s*([A-Z]{2}|[A-Za-z]+)\s+(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
-                # Pattern 3: Standard format - "..., City, County, State, ZIP, Country"
-                r'.*,\s*[^,]+,\s*([^,]+),\s*([A-Z]{2}|[A-Za-z]+),\s*(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
-                # Pattern 4: Alternative format - "..., City, State, ZIP"
-                r'.*,\s*([^,]+),\s*([A-Z]{2}|[A-Za-z]+),\s*(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
-                # Pattern 5: Just city, state, zip - "City, State ZIP"
-                r'([^,]+),\s*([A-Z]{2}|[A-Za-z]+)\s+(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, location, re.IGNORECASE)
-                if match:
-                    location_part = match.group(1).strip()
-                    state = match.group(2).strip()
-                    zip_code = match.group(3).strip()
-                    
-                    # Clean up location part (remove extra spaces and unwanted characters)
-                    location_clean = re.sub(r'\s+', ' ', location_part).strip()
-                    
-                    # Handle state abbreviations vs full state names
-                    if len(state) == 2:
-                        # It's already an abbreviation
-                        state_abbrev = state.upper()
-                    else:
-                        # Convert full state name to abbreviation
-                        state_map = {
-                            'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
-                            'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'Florida': 'FL', 'Georgia': 'GA',
-                            'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN', 'Iowa': 'IA',
-                            'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME', 'Maryland': 'MD',
-                            'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN', 'Mississippi': 'MS',
-                            'Missouri': 'MO', 'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV', 'New Hampshire': 'NH',
-                            'New Jersey': 'NJ', 'New Mexico': 'NM', 'New York': 'NY', 'North Carolina': 'NC',
-                            'North Dakota': 'ND', 'Ohio': 'OH', 'Oklahoma': 'OK', 'Oregon': 'OR', 'Pennsylvania': 'PA',
-                            'Rhode Island': 'RI', 'South Carolina': 'SC', 'South Dakota': 'SD', 'Tennessee': 'TN',
-                            'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT', 'Virginia': 'VA', 'Washington': 'WA',
-                            'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
-                        }
-                        state_abbrev = state_map.get(state.title(), state.upper())
-                    
-                    if location_clean and len(location_clean) > 0:
-                        return f"{location_clean}, {state_abbrev}, {zip_code}"
-            
-            # If no pattern matches, try to extract just city and state
-            # Fallback patterns for city, state format
-            fallback_patterns = [
-                # Pattern: "City, State"
-                r'.*,\s*([^,]+),\s*([A-Z]{2}|[A-Za-z]+)(?:,\s*[^,]*)?$',
-                # Pattern: "City, State ZIP"
-                r'.*,\s*([^,]+),\s*([A-Z]{2}|[A-Za-z]+)\s+\d{5}(?:-\d{4})?(?:,\s*[^,]*)?$'
-            ]
-            
-            for pattern in fallback_patterns:
-                match = re.search(pattern, location, re.IGNORECASE)
-                if match:
-                    city = match.group(1).strip()
-                    state = match.group(2).strip()
-                    
-                    # Clean up city name
-                    city_clean = re.sub(r'\s+', ' ', city).strip()
-                    
-                    # Handle state abbreviations vs full state names
-                    if len(state) == 2:
-                        state_abbrev = state.upper()
-                    else:
-                        state_map = {
-                            'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
-                            'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'Florida': 'FL', 'Georgia': 'GA',
-                            'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN', 'Iowa': 'IA',
-                            'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME', 'Maryland': 'MD',
-                            'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN', 'Mississippi': 'MS',
-                            'Missouri': 'MO', 'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV', 'New Hampshire': 'NH',
-                            'New Jersey': 'NJ', 'New Mexico': 'NM', 'New York': 'NY', 'North Carolina': 'NC',
-                            'North Dakota': 'ND', 'Ohio': 'OH', 'Oklahoma': 'OK', 'Oregon': 'OR', 'Pennsylvania': 'PA',
-                            'Rhode Island': 'RI', 'South Carolina': 'SC', 'South Dakota': 'SD', 'Tennessee': 'TN',
-                            'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT', 'Virginia': 'VA', 'Washington': 'WA',
-                            'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
-                        }
-                        state_abbrev = state_map.get(state.title(), state.upper())
-                    
-                    if city_clean and len(city_clean) > 0:
-                        return f"{city_clean}, {state_abbrev}"
-            
-            # Final fallback - return first 50 characters
-            return location[:50] + "..." if len(location) > 50 else location
-            
-        except Exception as e:
-            logger.error(f"Error shortening location: {e}")
-            return location
-
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        welcome_message = """
-🚛 **Driver Location Tracking Bot**
-
-Welcome! This bot helps you track driver locations and calculate distances.
-
-**Available Commands:**
-• `/location` - Get current driver location data
-• `/distance [address]` - Calculate distance to destination
-• `/help` - Show detailed help
-
-**Quick Start:**
-📍 Send `/location` to get current driver status
-📏 Type any address to calculate distance!
-
-**Examples:**
-• `123 Main Street, New York, NY`
-• `Times Square, NYC`
-• `LAX Airport`
-
-**Note:** This bot is restricted to authorized users only.
-        """
-        
-        await update.message.reply_text(welcome_message, parse_mode='Markdown')
-    
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        help_message = """
-🚛 **Driver Location Tracking Bot Help**
-
-**Basic Commands:**
-• `/location` - Fetch current driver location, speed, and name
-• `/distance [address]` - Calculate distance to destination + enable auto-updates
-• `/drivers` - List all available drivers
-• `/setdriver [name]` - Assign a driver to this group
-• `/groupinfo` - Show group configuration
-• `/setdestination [address]` - Set destination for automatic updates
-• `/stop` - Stop automatic updates
-• `/start` - Welcome message
-• `/help` - Show this help
-
-**Driver Management:**
-• `/adddriver` - Add a new driver to the system
-• `/editdriver [name]` - Edit driver information
-• `/removedriver [name]` - Remove a driver from the system
-• `/driverinfo [name]` - Show detailed driver information
-
-**Setup:**
-🔧 **First Time Setup:**
-1. Use `/drivers` to see available drivers
-2. Use `/setdriver [driver_name]` to assign a driver to this group
-3. Use `/location` to test the setup
-
-**Usage:**
-📍 **Get Location:** Send `/location` to get current driver status
-📏 **Calculate Distance:** 
-  - `/distance 123 Main St, New York, NY`
-  - Or just type any address directly!
-  - **Auto-updates will start every 2 hours!**
-
-🔄 **Auto-Updates:**
-• Use `/distance` or `/setdestination` to enable auto-updates
-• Bot will send location + distance updates every 2 hours
-• Use `/stop` to stop auto-updates
-
-**Examples:**
-• `1600 Pennsylvania Ave, Washington DC`
-• `Times Square, New York`
-• `LAX Airport, Los Angeles`
-
-**Data Format:**
-🚛 Name: [Driver Name]
-💨 Speed: [Speed] mph
-📍 Location: [Current Location]
-📏 Distance: [X.X] miles
-        """
-        
-        await update.message.reply_text(help_message, parse_mode='Markdown')
-    
-    async def location_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /location command"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        # Send "fetching data" message
-        status_message = await update.message.reply_text("🔄 Fetching driver location data...")
-        
-        try:
-            # Determine the correct ELD URL for the group
-            eld_url = self.get_eld_url_for_group(chat_id)
-            
-            # Check if no driver is assigned to this group
-            if eld_url is None:
-                await status_message.edit_text(
-                    "❌ **No driver assigned to this group!**\n\n"
-                    "Please assign a driver first:\n"
-                    "1. Use `/drivers` to see available drivers\n"
-                    "2. Use `/setdriver [driver_name]` to assign a driver\n\n"
-                    "**Example:** `/setdriver Khan Bismillah`",
-                    parse_mode='Markdown'
-                )
-                return
-            
-            # DEBUG: Log concurrent processing
-            logger.info(f"🔄 [QUEUE] Location command enqueued for chat {chat_id}")
-            
-            # DEBUG: Log which driver is being used for this group
-            driver = self.get_driver_by_chat_id(chat_id)
-            if driver:
-                logger.info(f"📍 [CONCURRENT] Location command for chat {chat_id} using driver: {driver['name']} (Unit: {driver['unit_number']})")
-            
-            logger.info(f"📍 Using ELD URL: {eld_url}")
-            
-            # Include chat_id in cache key to avoid collisions when multiple drivers share the same ELD URL
-            cache_key = f"location_{chat_id}_{eld_url}"
-            
-            # Check cache first
-            driver_data = self.get_cached_data(cache_key)
-            
-            if driver_data is None:
-                # Run extraction in thread pool for better performance
-                loop = asyncio.get_event_loop()
-                driver_data = await loop.run_in_executor(
-                    self.executor, 
-                    self.extract_driver_data_ultra_fast, 
-                    eld_url
-                )
-                # Cache the result
-                self.set_cached_data(cache_key, driver_data)
-            
-            # Check if driver is offline
-            is_offline = (driver_data['location'] == 'N/A' or 
-                         'Location not available' in driver_data['location'] or 
-                         'Error' in driver_data['location'])
-            
-            display_location = driver_data['location']
-            offline_warning = ""
-            
-            if is_offline:
-                offline_warning = "\n⚠️ **Status:** Driver offline - location not available"
-            
-            # Get driver status and track stop time
-            driver_status, speed_value = self.get_driver_status(driver_data)
-            stop_info = self.track_driver_stop_time(eld_url, driver_data)
-            
-            # Format response - shortened format
-            truck_info = f" (Truck: {driver_data['truck_number']})" if driver_data.get('truck_number') and driver_data['truck_number'] != 'N/A' else ""
-            
-            # Determine status icon based on speed
-            if is_offline:
-                status_icon = "🔴"
-                status_text = "Offline"
-            else:
-                status_icon = "🟢" if speed_value > 0 else "🔴"
-                status_text = "Driving" if speed_value > 0 else "Stopped"
-            
-            # Shorten location to city/state if it's too long
-            short_location = self.shorten_location(display_location) if not is_offline else display_location
-            
-            response = f"""📊 **Status:** {status_icon} {status_text}
-📍 **Current Location:** {short_location}"""
-            
-            # Add stop duration if driver is stopped
-            if stop_info and speed_value == 0:
-                stop_duration = (datetime.now() - stop_info['stopped_since']).total_seconds()
-                stop_minutes = int(stop_duration // 60)
-                if stop_minutes > 0:
-                    response += f"\n⏱️ **Stopped for:** {stop_minutes} minute(s)"
-            
-            # Update the status message with the result
-            await status_message.edit_text(response, parse_mode='Markdown')
-            
-        except Exception as e:
-            logger.error(f"Error in location_command: {e}")
-            await status_message.edit_text("❌ Error fetching driver data. Please try again later.")
-    
-    async def distance_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /distance command"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        # Check if destination address is provided
-        if not context.args:
-            await update.message.reply_text("📍 Please provide a destination address.\n\n**Example:** `/distance 123 Main St, New York, NY`")
-            return
-        
-        destination = ' '.join(context.args)
-        logger.info(f"Distance command requested: {destination}")
-        
-        # Send processing message
-        status_message = await update.message.reply_text("🔄 Calculating distance...")
-        
-        try:
-            # Determine the correct ELD URL for the group
-            eld_url = self.get_eld_url_for_group(chat_id)
-            
-            # Check if no driver is assigned to this group
-            if eld_url is None:
-                await status_message.edit_text(
-                    "❌ **No driver assigned to this group!**\n\n"
-                    "Please assign a driver first:\n"
-                    "1. Use `/drivers` to see available drivers\n"
-                    "2. Use `/setdriver [driver_name]` to assign a driver\n\n"
-                    "**Example:** `/setdriver Driver Name`",
-                    parse_mode='Markdown'
-                )
-                return
-            
-            # Include chat_id in cache key to avoid collisions when multiple drivers share the same ELD URL
-            cache_key = f"location_{chat_id}_{eld_url}"
-            
-            # Check cache first for driver location
-            driver_data = self.get_cached_data(cache_key)
-            
-            if driver_data is None:
-                # Run extraction in thread pool for better performance
-                loop = asyncio.get_event_loop()
-                driver_data = await loop.run_in_executor(
-                    self.executor, 
-                    self.extract_driver_data_ultra_fast, 
-                    eld_url
-                )
-                # Cache the result
-                self.set_cached_data(cache_key, driver_data)
-            
-            current_location = driver_data['location']
-            logger.info(f"Driver current location: {current_location}")
-            
-            if current_location == 'N/A' or current_location == 'Location not available (driver may be offline)':
-                await status_message.edit_text("❌ Driver is currently offline - location not available.")
-                return
-            
-            # Get driver status and track stop time
-            driver_status, speed_value = self.get_driver_status(driver_data)
-            stop_info = self.track_driver_stop_time(eld_url, driver_data)
-            
-            # Calculate distance and time
-            distance_data = self.calculate_distance_and_time(current_location, destination, chat_id, current_location)
-            
-            if distance_data is None:
-                error_msg = "❌ Error calculating distance. Please check the addresses and try again.\n\n⚠️ Using OpenStreetMap geocoding service. Some addresses may not be found. Try a simpler address format."
-                await status_message.edit_text(error_msg)
-                return
-            
-            # Format response - shortened format
-            truck_info = f" (Truck: {driver_data['truck_number']})" if driver_data.get('truck_number') and driver_data['truck_number'] != 'N/A' else ""
-            
-            # Determine status text based on speed
-            status_text = "Driving" if speed_value > 0 else "Stopped"
-            
-            # Shorten location to city/state if it's too long
-            short_location = self.shorten_location(current_location)
-            
-            response = f"""Status: {status_text}
-Miles left: {distance_data['distance_text']}
-ETA: {distance_data['duration_text']}"""
-            
-            # Add stop duration if driver is stopped
-            if stop_info and speed_value == 0:
-                stop_duration = (datetime.now() - stop_info['stopped_since']).total_seconds()
-                stop_minutes = int(stop_duration // 60)
-                if stop_minutes > 0:
-                    response += f"\nStopped for: {stop_minutes} minute(s)"
-            
-            # Add warning if using fallback method
-            if "straight-line" in distance_data['method'].lower():
-                response += "\n\nNote: This is straight-line distance, not driving distance. Actual driving distance may be longer."
-            
-            # Store destination for automatic updates
-            self.group_destinations[chat_id] = destination
-            
-            # Start individual auto-update timer for this group if not already running
-            await self.start_group_auto_update(chat_id)
-            
-            await status_message.edit_text(response)
-            
-        except Exception as e:
-            logger.error(f"Error in distance_command: {e}")
-            await status_message.edit_text("❌ Error calculating distance. Please try again later.")
-    async def handle_text_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle text messages for driver management and address calculation"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            return
-        
-        text = update.message.text.strip()
-        logger.info(f"Text message received: {text}")
-        
-        # Handle driver removal confirmation
-        if 'driver_to_remove' in context.user_data:
-            if text.upper() == 'YES':
-                driver_name = context.user_data['driver_to_remove']
-                success, message = self.remove_driver(driver_name)
-                
-                if success:
-                    await update.message.reply_text(
-                        f"✅ **Driver Removed Successfully!**\n\n"
-                        f"{message}\n\n"
-                        f"💡 Use `/drivers` to see remaining drivers."
-                    )
-                else:
-                    await update.message.reply_text(
-                        f"❌ **Failed to remove driver!**\n\n"
-                        f"Error: {message}"
-                    )
-            else:
-                await update.message.reply_text("❌ Driver removal cancelled.")
-            
-            # Clear the context
-            del context.user_data['driver_to_remove']
-            return
-        
-        # Handle driver editing
-        if 'driver_to_edit' in context.user_data:
-            driver_name = context.user_data['driver_to_edit']
-            
-            # Parse edit command: "field value"
-            parts = text.split(' ', 1)
-            if len(parts) < 2:
-                await update.message.reply_text(
-                    "❌ Invalid format!\n\n"
-                    "Please use: `field value`\n\n"
-                    "**Examples:**\n"
-                    "• `name John Smith`\n"
-                    "• `unit 777`\n"
-                    "• `url https://state-eld.us/shared-driver-link/xxxxx`"
-                )
-                return
-            
-            field, value = parts[0].lower(), parts[1]
-            
-            # Validate field
-            if field not in ['name', 'unit', 'url']:
-                await update.message.reply_text(
-                    "❌ Invalid field!\n\n"
-                    "Valid fields: **name**, **unit**, **url**\n\n"
-                    "**Examples:**\n"
-                    "• `name John Smith`\n"
-                    "• `unit 777`\n"
-                    "• `url https://state-eld.us/shared-driver-link/xxxxx`"
-                )
-                return
-            
-            # Map field names
-            field_map = {'name': 'name', 'unit': 'unit_number', 'url': 'eld_url'}
-            actual_field = field_map[field]
-            
-            success, message = self.edit_driver(driver_name, actual_field, value)
-            
-            if success:
-                await update.message.reply_text(
-                    f"✅ **Driver Updated Successfully!**\n\n"
-                    f"{message}\n\n"
-                    f"💡 Use `/driverinfo {driver_name}` to see updated info."
-                )
-            else:
-                await update.message.reply_text(
-                    f"❌ **Failed to update driver!**\n\n"
-                    f"Error: {message}"
-                )
-            
-            # Clear the context
-            del context.user_data['driver_to_edit']
-            return
-        
-        # Check if it looks like an address (contains numbers and letters)
-        if re.search(r'\d+.*[a-zA-Z]|[a-zA-Z].*\d+', text) and len(text) > 10:
-            # Send processing message
-            status_message = await update.message.reply_text("🔄 Calculating distance to this address...")
-            
-            try:
-                # Determine the correct ELD URL for the group
-                eld_url = self.get_eld_url_for_group(chat_id)
-                
-                # Check if no driver is assigned to this group
-                if eld_url is None:
-                    await status_message.edit_text(
-                        "❌ **No driver assigned to this group!**\n\n"
-                        "Please assign a driver first:\n"
-                        "1. Use `/drivers` to see available drivers\n"
-                        "2. Use `/setdriver [driver_name]` to assign a driver\n\n"
-                        "**Example:** `/setdriver Khan Bismillah`",
-                        parse_mode='Markdown'
-                    )
-                    return
-                
-                # Get current driver location using the fast method
-                loop = asyncio.get_event_loop()
-                driver_data = await loop.run_in_executor(
-                    self.executor, 
-                    self.extract_driver_data_ultra_fast, 
-                    eld_url
-                )
-                current_location = driver_data['location']
-                
-                logger.info(f"Driver current location for text message: {current_location}")
-                
-                if current_location == 'N/A' or current_location == 'Location not available (driver may be offline)':
-                    await status_message.edit_text("❌ Driver is currently offline - location not available.")
-                    return
-                
-                # Get driver status and track stop time
-                driver_status, speed_value = self.get_driver_status(driver_data)
-                stop_info = self.track_driver_stop_time(eld_url, driver_data)
-                
-                # Calculate distance and time
-                distance_data = self.calculate_distance_and_time(current_location, text, chat_id, current_location)
-                
-                if distance_data is None:
-                    error_msg = "❌ Could not find coordinates for the address. Please check the address format.\n\n⚠️ Using OpenStreetMap geocoding service. Try a simpler address format (e.g., 'Main St, City, State')."
-                    await status_message.edit_text(error_msg)
-                    return
-                
-                # Format response - shortened format
-                truck_info = f" (Truck: {driver_data['truck_number']})" if driver_data.get('truck_number') and driver_data['truck_number'] != 'N/A' else ""
-                
-                # Determine status text based on speed
-                status_text = "Driving" if speed_value > 0 else "Stopped"
-                
-                # Shorten location to city/state if it's too long
-                short_location = self.shorten_location(current_location)
-                
-                response = f"""Status: {status_text}
-Miles left: {distance_data['distance_text']}
-ETA: {distance_data['duration_text']}"""
-                
-                # Add stop duration if driver is stopped
-                if stop_info and speed_value == 0:
-                    stop_duration = (datetime.now() - stop_info['stopped_since']).total_seconds()
-                    stop_minutes = int(stop_duration // 60)
-                    if stop_minutes > 0:
-                        response += f"\nStopped for: {stop_minutes} minute(s)"
-                
-                # Add warning if using fallback method
-                if "straight-line" in distance_data['method'].lower():
-                    response += "\n\nNote: This is straight-line distance, not driving distance. Actual driving distance may be longer."
-                
-                # Store destination for automatic updates
-                self.group_destinations[chat_id] = text
-                
-                # Start individual auto-update timer for this group if not already running
-                await self.start_group_auto_update(chat_id)
-                
-                await status_message.edit_text(response)
-                
-            except Exception as e:
-                logger.error(f"Error in handle_text_message: {e}")
-                await status_message.edit_text("❌ Error calculating distance. Please try again later.")
-    
-    async def drivers_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /drivers command - list all available drivers"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        # DEBUG: Log the drivers command request
-        logger.info(f"🚛 Drivers command requested by chat {chat_id}")
-        
-        # DEBUG: Check if drivers_config exists and what's in it
-        logger.info(f"🔍 DEBUG: drivers_config type: {type(self.drivers_config)}")
-        logger.info(f"🔍 DEBUG: drivers_config content: {self.drivers_config}")
-        
-        # Try to reload configuration if it seems to be missing
-        if not self.drivers_config or not self.drivers_config.get('drivers'):
-            logger.warning("🔄 Drivers config seems empty, attempting to reload...")
-            self.drivers_config = self.load_drivers_config()
-            logger.info(f"🔄 Reloaded config: {len(self.drivers_config.get('drivers', []))} drivers")
-        
-        drivers = self.list_available_drivers()
-        
-        # DEBUG: Log the number of drivers loaded
-        logger.info(f"🚛 Found {len(drivers)} drivers in configuration")
-        
-        if not drivers:
-            await update.message.reply_text("❌ No drivers found in configuration.")
-            return
-        
-        response = "🚛 **Available Drivers:**\n\n"
-        
-        for i, driver in enumerate(drivers, 1):
-            status = "✅ Assigned" if driver['assigned_group'] else "⚪ Available"
-            response += f"{i}. **{driver['name']}** (Unit: {driver['unit_number']}) - {status}\n"
-        
-        response += "\n💡 **Tip:** Use `/setdriver [driver_name]` to assign a driver to this group"
-        
-        await update.message.reply_text(response, parse_mode='Markdown')
-    
-    async def setdriver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /setdriver command - assign a driver to this group"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        if not context.args:
-            await update.message.reply_text("📝 Please provide a driver name.\n\n**Example:** `/setdriver Addam Hayder`\n\n**Tip:** Use `/drivers` to see available drivers")
-            return
-        
-        driver_name = ' '.join(context.args)
-        logger.info(f"Setting driver '{driver_name}' for group {chat_id}")
-        
-        success, message = self.set_driver_for_group(chat_id, driver_name)
-        
-        if success:
-            await update.message.reply_text(f"✅ {message}")
-        else:
-            await update.message.reply_text(f"❌ {message}")
-    
-    async def groupinfo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /groupinfo command - show current group configuration"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        driver = self.get_driver_by_chat_id(chat_id)
-        
-        response = f"📊 **Group Information**\n\n"
-        response += f"**Chat ID:** `{chat_id}`\n"
-        
-        if driver:
-            response += f"**Assigned Driver:** {driver['name']}\n"
-            response += f"**Unit Number:** {driver['unit_number']}\n"
-            response += f"**Status:** ✅ Configured"
-        else:
-            response += f"**Assigned Driver:** None\n"
-            response += f"**Status:** ⚪ Not configured\n\n"
-            response += f"💡 **Tip:** Use `/setdriver [driver_name]` to assign a driver to this group"
-        
-        await update.message.reply_text(response, parse_mode='Markdown')
-    
-    # Driver Management Commands
-    
-    async def adddriver_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Start the add driver conversation"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return ConversationHandler.END
-        
-        await update.message.reply_text(
-            "🚛 **Add New Driver**\n\n"
-            "Let's add a new driver to the system.\n\n"
-            "**Step 1/3:** Please enter the driver's full name:\n\n"
-            "*Example: John Smith*\n\n"
-            "Send /cancel to cancel this operation.",
-            parse_mode='Markdown'
-        )
-        
-        return ADD_DRIVER_NAME
-    
-    async def adddriver_name(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle driver name input"""
-        name = update.message.text.strip()
-        
-        if not name or len(name) < 2:
-            await update.message.reply_text(
-                "❌ Please enter a valid driver name (at least 2 characters).\n\n"
-                "Try again or send /cancel to cancel."
-            )
-            return ADD_DRIVER_NAME
-        
-        # Check if driver already exists
-        for driver in self.drivers_config.get('drivers', []):
-            if driver['name'].lower() == name.lower():
-                await update.message.reply_text(
-                    f"❌ Driver '{name}' already exists!\n\n"
-                    "Please choose a different name or send /cancel to cancel."
-                )
-                return ADD_DRIVER_NAME
-        
-        # Store the name in context
-        context.user_data['new_driver_name'] = name
-        
-        await update.message.reply_text(
-            f"✅ **Driver Name:** {name}\n\n"
-            "**Step 2/3:** Please enter the unit/truck number:\n\n"
-            "*Example: 001, 777, K1995*\n\n"
-            "Send /cancel to cancel this operation.",
-            parse_mode='Markdown'
-        )
-        
-        return ADD_DRIVER_UNIT
-    
-    async def adddriver_unit(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle unit number input"""
-        unit_number = update.message.text.strip()
-        
-        if not unit_number or len(unit_number) < 1:
-            await update.message.reply_text(
-                "❌ Please enter a valid unit/truck number.\n\n"
-                "Try again or send /cancel to cancel."
-            )
-            return ADD_DRIVER_UNIT
-        
-        # Check if unit number already exists
-        for driver in self.drivers_config.get('drivers', []):
-            if driver['unit_number'].lower() == unit_number.lower():
-                await update.message.reply_text(
-                    f"❌ Unit number '{unit_number}' is already taken!\n\n"
-                    "Please choose a different unit number or send /cancel to cancel."
-                )
-                return ADD_DRIVER_UNIT
-        
-        # Store the unit number in context
-        context.user_data['new_driver_unit'] = unit_number
-        
-        await update.message.reply_text(
-            f"✅ **Driver Name:** {context.user_data['new_driver_name']}\n"
-            f"✅ **Unit Number:** {unit_number}\n\n"
-            "**Step 3/3:** Please enter the ELD shared driver link URL:\n\n"
-            "*The URL should look like:*\n"
-            "`https://state-eld.us/shared-driver-link/xxxxx-xxxxx-xxxxx`\n\n"
-            "Send /cancel to cancel this operation.",
-            parse_mode='Markdown'
-        )
-        
-        return ADD_DRIVER_URL
-    
-    async def adddriver_url(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle ELD URL input and complete driver creation"""
-        eld_url = update.message.text.strip()
-        
-        if not eld_url.startswith('https://state-eld.us/shared-driver-link/'):
-            await update.message.reply_text(
-                "❌ Invalid ELD URL format!\n\n"
-                "The URL must start with:\n"
-                "`https://state-eld.us/shared-driver-link/`\n\n"
-                "Please try again or send /cancel to cancel.",
-                parse_mode='Markdown'
-            )
-            return ADD_DRIVER_URL
-        
-        # Get data from context
-        name = context.user_data['new_driver_name']
-        unit_number = context.user_data['new_driver_unit']
-        
-        # Add the driver
-        success, message = self.add_new_driver(name, unit_number, eld_url)
-        
-        if success:
-            await update.message.reply_text(
-                f"🎉 **Driver Added Successfully!**\n\n"
-                f"**Name:** {name}\n"
-                f"**Unit:** {unit_number}\n"
-                f"**Status:** Ready for assignment\n\n"
-                f"✅ {message}\n\n"
-                f"💡 **Next Steps:**\n"
-                f"• Use `/setdriver {name}` to assign this driver to a group\n"
-                f"• Use `/drivers` to see all drivers",
-                parse_mode='Markdown'
-            )
-        else:
-            await update.message.reply_text(
-                f"❌ **Failed to add driver!**\n\n"
-                f"Error: {message}\n\n"
-                f"Please try again with `/adddriver`"
-            )
-        
-        # Clear context data
-        context.user_data.clear()
-        
-        return ConversationHandler.END
-    
-    async def cancel_conversation(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Cancel any ongoing conversation"""
-        context.user_data.clear()
-        await update.message.reply_text(
-            "❌ **Operation cancelled.**\n\n"
-            "You can start over anytime with the appropriate command."
-        )
-        return ConversationHandler.END
-    
-    async def removedriver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /removedriver command"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        if not context.args:
-            await update.message.reply_text(
-                "❌ Please provide a driver name to remove.\n\n"
-                "**Usage:** `/removedriver [driver_name]`\n\n"
-                "**Example:** `/removedriver John Smith`\n\n"
-                "💡 **Tip:** Use `/drivers` to see all available drivers.",
-                parse_mode='Markdown'
-            )
-            return
-        
-        driver_name = ' '.join(context.args)
-        
-        # Get driver info first
-        driver_info = self.get_driver_info(driver_name)
-        if not driver_info:
-            await update.message.reply_text(
-                f"❌ Driver '{driver_name}' not found!\n\n"
-                "💡 **Tip:** Use `/drivers` to see all available drivers."
-            )
-            return
-        
-        # Show confirmation
-        assigned_status = "🔗 Assigned to a group" if driver_info.get('telegram_group_id') else "⚪ Not assigned"
-        
-        await update.message.reply_text(
-            f"⚠️ **Confirm Driver Removal**\n\n"
-            f"**Name:** {driver_info['name']}\n"
-            f"**Unit:** {driver_info['unit_number']}\n"
-            f"**Status:** {assigned_status}\n\n"
-            f"❗ This action cannot be undone!\n\n"
-            f"Reply with **YES** to confirm removal, or anything else to cancel."
-        )
-        
-        # Store driver name for confirmation
-        context.user_data['driver_to_remove'] = driver_name
-    
-    async def driverinfo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /driverinfo command"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        if not context.args:
-            await update.message.reply_text(
-                "📋 Please provide a driver name to get information.\n\n"
-                "**Usage:** `/driverinfo [driver_name]`\n\n"
-                "**Example:** `/driverinfo John Smith`\n\n"
-                "💡 **Tip:** Use `/drivers` to see all available drivers.",
-                parse_mode='Markdown'
-            )
-            return
-        
-        driver_name = ' '.join(context.args)
-        driver_info = self.get_driver_info(driver_name)
-        
-        if not driver_info:
-            await update.message.reply_text(
-                f"❌ Driver '{driver_name}' not found!\n\n"
-                "💡 **Tip:** Use `/drivers` to see all available drivers."
-            )
-            return
-        
-        # Format driver information
-        assigned_group = driver_info.get('telegram_group_id')
-        if assigned_group:
-            assignment_status = f"🔗 Assigned to group {assigned_group}"
-        else:
-            assignment_status = "⚪ Not assigned to any group"
-        
-        # Mask the ELD URL for security (show only the last part)
-        eld_url = driver_info['eld_url']
-        if '/' in eld_url:
-            masked_url = eld_url.split('/')[-1][:8] + "..." + eld_url.split('/')[-1][-8:]
-        else:
-            masked_url = eld_url[:8] + "..." + eld_url[-8:] if len(eld_url) > 16 else eld_url
-        
-        response = f"""📋 **Driver Information**
-
-**Name:** {driver_info['name']}
-**Unit Number:** {driver_info['unit_number']}
-**ELD Link:** {masked_url}
-**Status:** {assignment_status}
-
-**Available Actions:**
-• `/setdriver {driver_info['name']}` - Assign to this group
-• `/editdriver {driver_info['name']}` - Edit driver info
-• `/removedriver {driver_info['name']}` - Remove driver"""
-        
-        await update.message.reply_text(response, parse_mode='Markdown')
-    
-    async def editdriver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /editdriver command"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        if not context.args:
-            await update.message.reply_text(
-                "🛠️ **Edit Driver**\n\n"
-                "Please provide a driver name to edit.\n\n"
-                "**Usage:** `/editdriver [driver_name]`\n\n"
-                "**Example:** `/editdriver John Smith`\n\n"
-                "💡 **Tip:** Use `/drivers` to see all available drivers.",
-                parse_mode='Markdown'
-            )
-            return
-        
-        driver_name = ' '.join(context.args)
-        driver_info = self.get_driver_info(driver_name)
-        
-        if not driver_info:
-            await update.message.reply_text(
-                f"❌ Driver '{driver_name}' not found!\n\n"
-                "💡 **Tip:** Use `/drivers` to see all available drivers."
-            )
-            return
-        
-        # Show current driver info and edit options
-        assigned_status = "🔗 Assigned" if driver_info.get('telegram_group_id') else "⚪ Not assigned"
-        
-        response = f"""🛠️ **Edit Driver: {driver_info['name']}**
-
-**Current Information:**
-• **Name:** {driver_info['name']}
-• **Unit:** {driver_info['unit_number']}
-• **Status:** {assigned_status}
-
-**What would you like to edit?**
-1️⃣ **Name** - Reply with: `name [new_name]`
-2️⃣ **Unit Number** - Reply with: `unit [new_unit]`
-3️⃣ **ELD URL** - Reply with: `url [new_url]`
-
-**Examples:**
-• `name Mike Johnson`
-• `unit 555`
-• `url https://state-eld.us/shared-driver-link/xxxxx`
-
-Reply with your choice, or send /cancel to cancel."""
-        
-        await update.message.reply_text(response, parse_mode='Markdown')
-        
-        # Store driver name for editing
-        context.user_data['driver_to_edit'] = driver_name
-    
-    async def unknown_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle unknown commands"""
-        user_id = update.effective_user.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        await update.message.reply_text("❓ Unknown command. Use /help to see available commands.")
-    
-    async def set_destination_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /setdestination command - set destination for automatic updates"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        if not context.args:
-            await update.message.reply_text("📍 Please provide a destination address.\n\n**Example:** `/setdestination 123 Main St, New York, NY`")
-            return
-        
-        destination = ' '.join(context.args)
-        self.group_destinations[chat_id] = destination
-        
-        # Start individual auto-update timer for this group if not already running
-        await self.start_group_auto_update(chat_id)
-        
-        await update.message.reply_text(f"✅ **Destination set for automatic updates:**\n\n📍 {destination}\n\n🔄 The bot will now send location updates every {self.auto_update_interval//3600} hour(s) with distance remaining to this destination.")
-    
-    async def clear_destination_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /stop command - clear destination for automatic updates"""
-        user_id = update.effective_user.id
-        chat_id = update.effective_chat.id
-        
-        if not self.is_authorized(user_id):
-            await update.message.reply_text("❌ You are not authorized to use this bot.")
-            return
-        
-        if chat_id in self.group_destinations:
-            del self.group_destinations[chat_id]
-            
-            # Cancel the individual auto-update task for this group
-            await self.stop_group_auto_update(chat_id)
-            
-            await update.message.reply_text("✅ **Automatic updates disabled.**\n\nDestination cleared. The bot will no longer send automatic location updates.")
-        else:
-            await update.message.reply_text("⚠️ No destination is currently set for this group.")
-    
-    
-    async def process_group_update(self, chat_id, destination):
-        """Process update for a single group - designed to run concurrently"""
-        try:
-            logger.info(f"Processing auto-update for group {chat_id} to destination {destination}")
-            
-            # Get driver for this group
-            driver = self.get_driver_by_chat_id(chat_id)
-            if not driver:
-                logger.warning(f"No driver assigned to group {chat_id}, skipping auto-update")
-                return
-            
-            # Get ELD URL for this group
-            eld_url = self.get_eld_url_for_group(chat_id)
-            
-            # Extract current driver data
-            driver_data = await asyncio.get_event_loop().run_in_executor(
-                self.executor, 
-                self.extract_driver_data_ultra_fast, 
-                eld_url
-            )
-            
-            current_location = driver_data['location']
-            logger.info(f"Auto-update: Driver current location: {current_location}")
-            
-            if current_location == 'N/A' or current_location == 'Location not available (driver may be offline)':
-                logger.warning(f"Driver offline for group {chat_id}, skipping auto-update")
-                return
-            
-            # Get driver status and track stop time
-            driver_status, speed_value = self.get_driver_status(driver_data)
-            stop_info = self.track_driver_stop_time(eld_url, driver_data)
-            
-            # Check for extended stop and send alert if needed
-            extended_stop, stop_minutes = self.check_extended_stop(eld_url)
-            if extended_stop:
-                alert_message = f"""🚨 **EXTENDED STOP ALERT**
-                
-🚛 **Driver:** {driver_data['name']}
-🛑 **Status:** Driver has been stopped for {stop_minutes} minutes
-📍 **Location:** {current_location}
-⚠️ **Alert:** Driver stopped for more than 45 minutes"""
-                
-                await self.application.bot.send_message(
-                    chat_id=chat_id,
-                    text=alert_message,
-                    parse_mode='Markdown'
-                )
-                logger.info(f"Sent extended stop alert to group {chat_id}")
-            
-            # Calculate distance and time to destination
-            distance_data = self.calculate_distance_and_time(current_location, destination, chat_id, current_location)
-            
-            if distance_data is None:
-                logger.error(f"Failed to calculate distance for group {chat_id}")
-                return
-            
-            # Format the automatic update message - shortened format
-            truck_info = f" (Truck: {driver_data['truck_number']})" if driver_data.get('truck_number') and driver_data['truck_number'] != 'N/A' else ""
-            
-            # Determine status text based on speed
-            status_text = "Driving" if speed_value > 0 else "Stopped"
-            
-            # Shorten location to city/state if it's too long
-            short_location = self.shorten_location(current_location)
-            
-            update_message = f"""Status: {status_text}
-Miles left: {distance_data['distance_text']}
-ETA: {distance_data['duration_text']}"""
-            
-            # Add stop duration if driver is stopped
-            if stop_info and speed_value == 0:
-                stop_duration = (datetime.now() - stop_info['stopped_since']).total_seconds()
-                stop_minutes = int(stop_duration // 60)
-                if stop_minutes > 0:
-                    update_message += f"\nStopped for: {stop_minutes} minute(s)"
-            
-            # Add warning if using fallback method
-            if "straight-line" in distance_data['method'].lower():
-                update_message += "\n\nNote: This is straight-line distance, not driving distance. Actual driving distance may be longer."
-            
-            # Send the update message to the group
-            await self.application.bot.send_message(
-                chat_id=chat_id,
-                text=update_message
-            )
-            
-            logger.info(f"Sent auto-update to group {chat_id}")
-            
-        except Exception as e:
-            logger.error(f"Error in auto-update for group {chat_id}: {e}")
-    
-    async def start_group_auto_update(self, chat_id):
-        """Start individual auto-update timer for a specific group"""
-        # Cancel existing task if running
-        await self.stop_group_auto_update(chat_id)
-        
-        # Create new task for this group
-        task = asyncio.create_task(self.group_auto_update_loop(chat_id))
-        self.group_update_tasks[chat_id] = task
-        
-        logger.info(f"Started individual auto-update timer for group {chat_id}")
-    
-    async def stop_group_auto_update(self, chat_id):
-        """Stop individual auto-update timer for a specific group"""
-        if chat_id in self.group_update_tasks:
-            task = self.group_update_tasks[chat_id]
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            del self.group_update_tasks[chat_id]
-            logger.info(f"Stopped individual auto-update timer for group {chat_id}")
-    
-    async def group_auto_update_loop(self, chat_id):
-        """Individual auto-update loop for a specific group"""
-        logger.info(f"Starting individual auto-update loop for group {chat_id}")
-        
-        while True:
-            try:
-                # Wait for the specified interval (2 hours)
-                await asyncio.sleep(self.auto_update_interval)
-                
-                # Check if destination is still set for this group
-                if chat_id not in self.group_destinations:
-                    logger.info(f"No destination set for group {chat_id}, stopping auto-update")
-                    break
-                
-                destination = self.group_destinations[chat_id]
-                logger.info(f"Running individual auto-update for group {chat_id} to destination {destination}")
-                
-                # Process update for this specific group
-                await self.process_group_update(chat_id, destination)
-                
-                logger.info(f"Completed individual auto-update for group {chat_id}")
-                
-            except asyncio.CancelledError:
-                logger.info(f"Auto-update loop cancelled for group {chat_id}")
-                break
-            except Exception as e:
-                logger.error(f"Error in individual auto-update loop for group {chat_id}: {e}")
-                # Continue the loop even if there's an error
-    
-    def run(self):
-        """Start the bot"""
-        try:
-            # Create application
-            application = Application.builder().token(self.bot_token).build()
-            
-            # Store application reference for auto-updates
-            self.application = application
-            
-            # Add conversation handler for adding drivers
-            add_driver_handler = ConversationHandler(
-                entry_points=[CommandHandler('adddriver', self.adddriver_start)],
-                states={
-                    ADD_DRIVER_NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.adddriver_name)],
-                    ADD_DRIVER_UNIT: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.adddriver_unit)],
-                    ADD_DRIVER_URL: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.adddriver_url)],
-                },
-                fallbacks=[CommandHandler('cancel', self.cancel_conversation)]
-            )
-            
-            # Add handlers
-            application.add_handler(CommandHandler("start", self.start_command))
-            application.add_handler(CommandHandler("help", self.help_command))
-            application.add_handler(CommandHandler("location", self.location_command))
-            application.add_handler(CommandHandler("distance", self.distance_command))
-            application.add_handler(CommandHandler("drivers", self.drivers_command))
-            application.add_handler(CommandHandler("setdriver", self.setdriver_command))
-            application.add_handler(CommandHandler("groupinfo", self.groupinfo_command))
-            application.add_handler(CommandHandler("setdestination", self.set_destination_command))
-            application.add_handler(CommandHandler("stop", self.clear_destination_command))
-            
-            # Add driver management handlers
-            application.add_handler(add_driver_handler)
-            application.add_handler(CommandHandler("editdriver", self.editdriver_command))
-            application.add_handler(CommandHandler("removedriver", self.removedriver_command))
-            application.add_handler(CommandHandler("driverinfo", self.driverinfo_command))
-            
-            # Add text message handler for address detection
-            application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text_message))
-            
-            # Add error handler
-            async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
-                logger.error(f"Exception while handling an update: {context.error}")
-            
-            application.add_error_handler(error_handler)
-            
-            # No global auto-update task needed - individual group timers are started when needed
-            async def post_init(application):
-                """Initialize application after start"""
-                logger.info("Bot initialized - individual group auto-update timers will start when distance commands are used")
-            
-            application.post_init = post_init
-            
-            # Start the bot
-            logger.info("Starting bot...")
-            application.run_polling(allowed_updates=Update.ALL_TYPES)
-            
-        except Exception as e:
-            logger.error(f"Error starting bot: {e}")
-            raise
-
-def main():
-    """Main function"""
-    try:
-        bot = LocationBot()
-        bot.run()
-    except Exception as e:
-        logger.error(f"Fatal error: {e}")
-        print(f"❌ Error: {e}")
-
-if __name__ == "__main__":
-    main()
+import os
+import asyncio
+import logging
+from dotenv import load_dotenv
+from telegram import Update
+from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters, ConversationHandler
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+import orjson
+import queue
+import heapq
+import sqlite3
+import tempfile
+import re
+import time
+import aiohttp
+import numpy as np
+from math import radians, cos, sin, asin, sqrt, pi
+from dataclasses import dataclass
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+import threading
+from functools import lru_cache
+from cachetools import TTLCache
+
+# Load environment variables
+# Get the directory where this script is located
+script_dir = os.path.dirname(os.path.abspath(__file__))
+env_file = os.path.join(script_dir, '.env')
+load_dotenv(env_file)
+
+# Configure logging
+logging.basicConfig(
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    # Hot-path diagnostics log at DEBUG; opt in via DEBUG=1
+    level=logging.DEBUG if os.getenv('DEBUG') == '1' else logging.INFO
+)
+logger = logging.getLogger(__name__)
+
+# Conversation states for driver management
+ADD_DRIVER_NAME, ADD_DRIVER_UNIT, ADD_DRIVER_URL = range(3)
+
+# Optional numba JIT for the haversine inner math. The bot works fine
+# without it; when numba is installed the core compiles to native code.
+try:
+    from numba import njit
+except ImportError:
+    def njit(func):
+        return func
+
+
+@njit
+def _haversine_miles(lat1, lon1, lat2, lon2):
+    """Great-circle distance in miles between two points given in radians"""
+    s1 = sin((lat2 - lat1) * 0.5)
+    s2 = sin((lon2 - lon1) * 0.5)
+    a = s1 * s1 + cos(lat1) * cos(lat2) * s2 * s2
+    return 3959.0 * 2.0 * asin(sqrt(a))
+
+
+@dataclass(slots=True)
+class _DistanceRecord:
+    """Last accepted distance for a (chat_id, destination) pair"""
+    distance: float
+    driver_location: str
+
+
+# Haversine constants - degree-to-radian factor and earth radius in miles
+_D2R = pi / 180.0
+_R_MI = 3959.0
+
+
+@lru_cache(maxsize=4096)
+def _to_rad(lat, lon):
+    """Degrees-to-radians pair, memoized - the same driver/destination
+    coordinates recur across updates, so the conversion is paid once"""
+    return lat * _D2R, lon * _D2R
+
+# Full state name -> USPS abbreviation, built once at import instead of per
+# shorten_location call (the function previously rebuilt this dict inline)
+_STATE_MAP = {
+    'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
+    'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'Florida': 'FL', 'Georgia': 'GA',
+    'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN', 'Iowa': 'IA',
+    'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME', 'Maryland': 'MD',
+    'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN', 'Mississippi': 'MS',
+    'Missouri': 'MO', 'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV', 'New Hampshire': 'NH',
+    'New Jersey': 'NJ', 'New Mexico': 'NM', 'New York': 'NY', 'North Carolina': 'NC',
+    'North Dakota': 'ND', 'Ohio': 'OH', 'Oklahoma': 'OK', 'Oregon': 'OR', 'Pennsylvania': 'PA',
+    'Rhode Island': 'RI', 'South Carolina': 'SC', 'South Dakota': 'SD', 'Tennessee': 'TN',
+    'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT', 'Virginia': 'VA', 'Washington': 'WA',
+    'West Virginia': 'WV', 'Wisconsin': 'WI', 'Wyoming': 'WY'
+}
+
+# Reverse index resolving either form to the abbreviation in one lookup:
+# lowercase full names ("illinois") and lowercase abbreviations ("il")
+_STATE_LOOKUP = {name.lower(): abbr for name, abbr in _STATE_MAP.items()}
+_STATE_LOOKUP.update({abbr.lower(): abbr for abbr in _STATE_MAP.values()})
+
+# Location-shortening patterns: primary set extracts "place, state, zip",
+# fallback set extracts "city, state". Compiled once so shorten_location
+# skips the re-cache probe on every call.
+# Case-explicit classes instead of re.IGNORECASE: the flag makes the sre
+# engine case-fold every character scanned while backtracking, and these
+# patterns already spell out the classes they accept
+_SHORTEN_PATTERNS = [re.compile(p) for p in (
+    # Pattern 1: Full address with county - "..., County Name, State, ZIP, Country"
+    r'.*,\s*([^,]*[Cc]ounty[^,]*),\s*([A-Z]{2}|[A-Za-z]+),\s*(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
+    # Pattern 2: Full address with county - "..., County Name, State ZIP, Country"
+    r'.*,\s*([^,]*[Cc]ounty[^,]*),\s*([A-Z]{2}|[A-Za-z]+)\s+(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
+    # Pattern 3: Standard format - "..., City, County, State, ZIP, Country"
+    r'.*,\s*[^,]+,\s*([^,]+),\s*([A-Z]{2}|[A-Za-z]+),\s*(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
+    # Pattern 4: Alternative format - "..., City, State, ZIP"
+    r'.*,\s*([^,]+),\s*([A-Z]{2}|[A-Za-z]+),\s*(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
+    # Pattern 5: Just city, state, zip - "City, State ZIP"
+    r'([^,]+),\s*([A-Z]{2}|[A-Za-z]+)\s+(\d{5}(?:-\d{4})?)(?:,\s*[^,]*)?$',
+)]
+# Rough "looks like an address" check for inbound text messages
+_ADDRESS_LIKE_RE = re.compile(r'\d+.*[a-zA-Z]|[a-zA-Z].*\d+')
+
+# Precompiled address-parsing patterns (hot path - compiled once at import)
+_RE_WS = re.compile(r'\s+')
+_RE_STREET = re.compile(r'(\d+)\s+([^,]+),\s*([^,]+),\s*([A-Z]{2})')
+
+# Precompiled ELD page extraction patterns (scanned per scrape); the
+# single-pass extraction loops only ever needed the double-newline form
+# the page actually renders, so just that one is compiled per field
+_NAME_RE = re.compile(r'Name\s*\n\s*\n\s*([A-Za-z\s]+?)\s*\n\s*\n\s*Truck Number', re.IGNORECASE)
+_LOC_RE = re.compile(r'Current Location\s*\n\s*\n\s*([^\n]+)', re.IGNORECASE)
+# One alternation covering all four ELD fields so the page text is scanned
+# once instead of once per pattern; the name branch looks ahead to (rather
+# than consumes) the Truck Number header so both can match in one pass
+_ELD_COMBINED = re.compile(
+    r'Name\s*\n\s*\n\s*(?P<name>[^\n]+?)\s*\n\s*\n\s*(?=Truck Number)'
+    r'|Truck Number\s*\n\s*\n\s*(?P<truck>[^\n]+)'
+    r'|Current Location\s*\n\s*\n\s*(?P<loc>[^\n]+)'
+    r'|Speed\s*\n\s*\n\s*(?P<speed>[\d.]+|N/A)'
+    r'|(?P<mph>[\d.]+)(?=\s*mph)',
+    re.IGNORECASE
+)
+_RE_MPH = re.compile(r'(\d+\.?\d*)\s*mph', re.IGNORECASE)
+_RE_MPH_DEC = re.compile(r'(\d+\.\d+)\s*mph', re.IGNORECASE)
+_RE_NAME_SIMPLE = re.compile(r'Name\s*\n\s*\n\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE)
+
+# Targeted DOM extraction: ask the page for just the four labelled values in
+# one execute_script round-trip instead of serializing the whole rendered
+# page text to Python
+_ELD_FIELDS_JS = """
+const labels = {'Name': 'name', 'Truck Number': 'truck_number',
+                'Speed': 'speed', 'Current Location': 'location'};
+const out = {};
+for (const el of document.body.querySelectorAll('*')) {
+    if (el.children.length !== 0) continue;
+    const label = (el.textContent || '').trim();
+    if (label in labels && !(labels[label] in out)) {
+        const sib = el.nextElementSibling;
+        if (sib) {
+            const value = (sib.textContent || '').trim();
+            if (value) out[labels[label]] = value;
+        }
+    }
+}
+return out;
+"""
+
+# Precompiled sanitize_address patterns
+_SANITIZE_TAIL = re.compile(r'[^a-zA-Z0-9,\s]+$')
+_RE_GMAPS_NOTE = re.compile(r'\bOpen in Google Maps\b', re.IGNORECASE)
+_RE_NO_LOCATION = re.compile(r'\bLocation not available\b', re.IGNORECASE)
+
+
+# Static command responses - built once at import and shared by every
+# handler invocation
+_NOT_AUTHORIZED_MSG = "❌ You are not authorized to use this bot."
+_EXT_STOP_TMPL = (
+    "🚨 **EXTENDED STOP ALERT**\n"
+    "\n"
+    "🚛 **Driver:** {name}\n"
+    "🛑 **Status:** Driver has been stopped for {minutes} minutes\n"
+    "📍 **Location:** {location}\n"
+    "⚠️ **Alert:** Driver stopped for more than 45 minutes"
+)
+_UPDATE_TMPL = "Status: {status}\nMiles left: {miles}\nETA: {eta}"
+_NO_DRIVER_ASSIGNED_MSG = (
+    "❌ **No driver assigned to this group!**\n\n"
+    "Please assign a driver first:\n"
+    "1. Use `/drivers` to see available drivers\n"
+    "2. Use `/setdriver [driver_name]` to assign a driver\n\n"
+    "**Example:** `/setdriver Khan Bismillah`"
+)
+_WELCOME_MESSAGE = """
+🚛 **Driver Location Tracking Bot**
+
+Welcome! This bot helps you track driver locations and calculate distances.
+
+**Available Commands:**
+• `/location` - Get current driver location data
+• `/distance [address]` - Calculate distance to destination
+• `/help` - Show detailed help
+
+**Quick Start:**
+📍 Send `/location` to get current driver status
+📏 Type any address to calculate distance!
+
+**Examples:**
+• `123 Main Street, New York, NY`
+• `Times Square, NYC`
+• `LAX Airport`
+
+**Note:** This bot is restricted to authorized users only.
+        """
+_HELP_MESSAGE = """
+🚛 **Driver Location Tracking Bot Help**
+
+**Basic Commands:**
+• `/location` - Fetch current driver location, speed, and name
+• `/distance [address]` - Calculate distance to destination + enable auto-updates
+• `/drivers` - List all available drivers
+• `/setdriver [name]` - Assign a driver to this group
+• `/groupinfo` - Show group configuration
+• `/setdestination [address]` - Set destination for automatic updates
+• `/stop` - Stop automatic updates
+• `/start` - Welcome message
+• `/help` - Show this help
+
+**Driver Management:**
+• `/adddriver` - Add a new driver to the system
+• `/editdriver [name]` - Edit driver information
+• `/removedriver [name]` - Remove a driver from the system
+• `/driverinfo [name]` - Show detailed driver information
+
+**Setup:**
+🔧 **First Time Setup:**
+1. Use `/drivers` to see available drivers
+2. Use `/setdriver [driver_name]` to assign a driver to this group
+3. Use `/location` to test the setup
+
+**Usage:**
+📍 **Get Location:** Send `/location` to get current driver status
+📏 **Calculate Distance:** 
+  - `/distance 123 Main St, New York, NY`
+  - Or just type any address directly!
+  - **Auto-updates will start every 2 hours!**
+
+🔄 **Auto-Updates:**
+• Use `/distance` or `/setdestination` to enable auto-updates
+• Bot will send location + distance updates every 2 hours
+• Use `/stop` to stop auto-updates
+
+**Examples:**
+• `1600 Pennsylvania Ave, Washington DC`
+• `Times Square, New York`
+• `LAX Airport, Los Angeles`
+
+**Data Format:**
+🚛 Name: [Driver Name]
+💨 Speed: [Speed] mph
+📍 Location: [Current Location]
+📏 Distance: [X.X] miles
+        """
+
+
+# Location strings that mean the driver is offline or the scrape failed
+_OFFLINE_SENTINELS = ('Location not available', 'Error')
+
+
+def _is_offline_location(location):
+    """True when a scraped location is the N/A, offline or error sentinel"""
+    return location == 'N/A' or any(tok in location for tok in _OFFLINE_SENTINELS)
+
+class LocationBot:
+    def __init__(self):
+        self.bot_token = os.getenv('BOT_TOKEN')
+        self.authorized_users = [int(user_id) for user_id in os.getenv('AUTHORIZED_USERS', '').split(',') if user_id.strip()]
+        self.eld_url = os.getenv('ELD_URL')
+        # Optional direct JSON endpoint for driver data. When the backend API
+        # behind the shared-driver-link page is known (captured once from the
+        # page's XHR in DevTools), set e.g.
+        #   ELD_API_TEMPLATE=https://state-eld.us/api/shared-driver-link/{token}
+        # and extraction skips Chrome entirely, dropping from seconds to
+        # milliseconds. Selenium remains the fallback.
+        self.eld_api_template = os.getenv('ELD_API_TEMPLATE')
+        # Load drivers configuration from JSON file
+        # Use the script directory that was already determined
+        self.drivers_config_file = os.path.join(script_dir, 'drivers_config.json')
+        self._drivers_config_mtime = None
+        self.drivers_config = self.load_drivers_config()
+        self._rebuild_driver_index()
+        
+        # Create a mapping from chat_id to driver info for quick lookup
+        self.chat_to_driver = {}
+        for driver in self.drivers_config.get('drivers', []):
+            if driver.get('telegram_group_id'):
+                self.chat_to_driver[str(driver['telegram_group_id'])] = driver
+                logger.info(f"✅ Loaded driver mapping: Chat {driver['telegram_group_id']} -> {driver['name']} (Unit: {driver['unit_number']})")
+        
+        logger.info(f"📊 Total driver mappings loaded: {len(self.chat_to_driver)}")
+        
+        # Performance optimizations
+        self.cache_lock = threading.Lock()
+        self.cache_duration = 15  # Reduce cache duration to 15 seconds for fresher data
+        # Driver-data cache is sharded so concurrent extractor threads don't
+        # all serialize on a single lock; each shard is its own TTLCache
+        self.cache_shards = [
+            (TTLCache(maxsize=128, ttl=self.cache_duration), threading.Lock())
+            for _ in range(8)
+        ]
+        # Thread pool is only for blocking Selenium work now - HTTP runs on
+        # the event loop via aiohttp, so the pool is sized to the browser
+        # limit. ELD_POOL_SIZE overrides it for deployments tracking many
+        # groups at once.
+        pool_size = int(os.getenv('ELD_POOL_SIZE', '8'))
+        self.selenium_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='eld')
+        self.selenium_semaphore = threading.Semaphore(pool_size)  # Limit concurrent Selenium instances to prevent resource exhaustion
+
+        # Per-chat locks preserve ordering of updates within a chat while
+        # still allowing cross-chat concurrency
+        self._chat_locks = {}
+        # In-flight scrape futures keyed by ELD URL - concurrent callers
+        # for the same driver share one scrape instead of duplicating it,
+        # and a short URL-keyed window absorbs back-to-back ticks
+        self._inflight = {}
+        self._eld_recent = TTLCache(maxsize=128, ttl=10)
+
+        # Pool of long-lived headless Chrome instances reused across updates.
+        # Chrome cold-start (~2-5s) dominated scraping latency when a fresh
+        # browser was launched per request. Instances are created lazily up
+        # to the semaphore limit and recycled on WebDriverException.
+        self.driver_pool = queue.Queue()
+        self.driver_pool_size = pool_size
+        self._driver_pool_created = 0
+        self._driver_pool_lock = threading.Lock()
+        
+        # Shared aiohttp session so OSRM/Nominatim calls reuse pooled keep-alive
+        # connections and can run concurrently on the bot's event loop.
+        # Created lazily because it must be bound to the running loop.
+        self._ua_headers = {'User-Agent': 'TelegramBot/1.0'}
+        self.aio = None
+
+        # Debounced config writer - handlers mark the config dirty and a
+        # background daemon coalesces a burst of changes into one atomic write
+        self._config_dirty = threading.Event()
+        self._config_writer = threading.Thread(target=self._config_flush_loop, daemon=True)
+        self._config_writer.start()
+
+        # Auto-update settings
+        self.auto_update_interval = 7200  # 2 hours for automatic updates
+        self.application = None
+        # Bound send_message resolved once at startup - the per-tick
+        # attribute chain through application.bot is skipped on hot sends
+        self._send_message = None
+        
+        # Store destination addresses and individual timers for each group
+        self.group_destinations = {}  # {chat_id: destination_address}
+        # Destination coordinates resolved once when the destination is set,
+        # so ticks skip re-geocoding a string that never changes
+        self.group_dest_coords = {}  # {chat_id: (lat, lon)}
+        # Bumped on every destination set/clear so in-flight ticks can tell
+        # their captured destination went stale during the slow fetch
+        self._dest_version = {}
+        # Single heap-based scheduler instead of one sleeping coroutine per
+        # group: (next_due_monotonic, chat_id) entries, a dict of current due
+        # times to invalidate stale heap entries, and a wake event
+        self._schedule = []
+        self._scheduled = {}  # {chat_id: next_due_monotonic}
+        # Last auto-update report per group, for the distance-threshold gate:
+        # {chat_id: {'lat', 'lon', 'status', 'ts'}}
+        self._last_report = {}
+        self._schedule_wake = None
+        self._scheduler_task = None
+        # Bounds simultaneous group updates so aligned ticks don't stampede
+        # the scrape pool and the Bot API all at once (created lazily on the
+        # running loop, like the wake event)
+        self.max_concurrent_updates = int(os.getenv('MAX_CONCURRENT_UPDATES', '8'))
+        self._update_sem = None
+        # Strong references to in-flight update tasks: the event loop only
+        # keeps weak refs, so fire-and-forget ticks could otherwise be
+        # garbage-collected mid-run. Done-callbacks drop them automatically.
+        self._update_tasks = set()
+        # Adaptive per-group polling interval: short while driving (ETAs
+        # drift), long while parked. Falls back to auto_update_interval.
+        self._group_next_delay = {}
+        
+        # Track driver stop times for extended stop alerts
+        self.driver_stop_times = {}  # {driver_url: {'stopped_since': monotonic float, 'location': str, 'notified': bool}}
+        self.extended_stop_threshold = 45 * 60  # 45 minutes in seconds
+        
+        # Geocoding cache to prevent inconsistent coordinates
+        # TTLCache handles expiry internally - no manual timestamp checks needed
+        self.geocoding_cache_duration = 3600  # 1 hour cache for addresses
+        self.geocoding_cache = TTLCache(maxsize=4096, ttl=self.geocoding_cache_duration)  # {address: (lat, lon)}
+        self.geocoding_persist_duration = 7 * 24 * 3600  # addresses don't move - keep disk entries for a week
+
+        # Durable geocoding store so restarts don't re-hit Nominatim for
+        # addresses we already resolved
+        self._geo_db = sqlite3.connect(
+            os.path.join(script_dir, 'geocache.sqlite'),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._geo_db.execute('PRAGMA journal_mode=WAL')
+        self._geo_db.execute('CREATE TABLE IF NOT EXISTS geo (key TEXT PRIMARY KEY, lat REAL, lon REAL, ts REAL)')
+        self._geo_db.execute('CREATE TABLE IF NOT EXISTS route (key TEXT PRIMARY KEY, data BLOB, ts REAL)')
+        # Geo and route rows are keyed by the driver's current location,
+        # which changes every tick for a moving truck, so most rows are
+        # written once and never replaced. Purge anything older than the
+        # freshness window each reader enforces, both at startup and
+        # periodically while running, or the file grows by a row per tick
+        # per group forever.
+        self.route_persist_duration = 600
+        self._geo_db.execute('DELETE FROM route WHERE ts < ?', (time.time() - self.route_persist_duration,))
+        self._geo_db.execute('DELETE FROM geo WHERE ts < ?', (time.time() - self.geocoding_persist_duration,))
+        self._route_prune_ts = time.monotonic()
+        self._geo_prune_ts = time.monotonic()
+
+        # Distance validation to prevent incorrect calculations
+        self.distance_cache_duration = 60  # 1 minute cache for distance calculations
+        self.distance_cache = TTLCache(maxsize=1024, ttl=self.distance_cache_duration)
+        # Memoized calculate_distance_and_time results - users paste the
+        # same destination repeatedly, and groups sharing a driver and
+        # destination hit identical routes on every auto-update tick
+        self.route_cache = TTLCache(maxsize=1024, ttl=600)  # {(origin, destination): route result dict} - chat-free key so groups share routes
+        
+        
+        if not self.bot_token:
+            raise ValueError("BOT_TOKEN not found in environment variables")
+        
+        # ELD_URL is not needed if drivers_config.json has driver configurations
+        if not self.eld_url and not self.drivers_config.get('drivers'):
+            raise ValueError("ELD_URL or drivers_config.json with driver configurations not found")
+        
+        # Using OSRM API + OpenStreetMap for all distance calculations and geocoding
+        logger.info("✅ Using OSRM API + OpenStreetMap for distance calculations and geocoding")
+    
+    def _chat_lock(self, chat_id):
+        """Get (or create) the asyncio.Lock that serializes work for one chat"""
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        return lock
+
+    async def _extract_coalesced(self, eld_url):
+        """Single-flight scrape dispatch keyed by ELD URL: if an extraction
+        for the same page is already running (an auto-update firing while a
+        command is handled, or several groups sharing one driver), later
+        callers await the in-flight future instead of scraping the page
+        again. A short TTL window also absorbs back-to-back ticks."""
+        with self.cache_lock:
+            recent = self._eld_recent.get(eld_url)
+        if recent is not None:
+            logger.debug("Recent scrape reused for %s", eld_url)
+            return recent
+        fut = self._inflight.get(eld_url)
+        if fut is not None:
+            return await fut
+        # get_running_loop is both faster and deprecation-proof inside a
+        # coroutine - there is no fallback path to pay for
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._inflight[eld_url] = fut
+        try:
+            # JSON-API path runs right here on the event loop; only the
+            # Selenium fallback needs an executor thread
+            driver_data = await self._extract_driver_data_http_async(eld_url)
+            if driver_data is None:
+                driver_data = await loop.run_in_executor(
+                    self.selenium_executor,
+                    self._extract_selenium_only,
+                    eld_url
+                )
+        except Exception as e:
+            if not fut.done():
+                fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(driver_data)
+            with self.cache_lock:
+                self._eld_recent[eld_url] = driver_data
+            return driver_data
+        finally:
+            # A cancelled owner raises BaseException past the handler above;
+            # cancel the shared future here so coalesced waiters wake up
+            # instead of awaiting a future nobody will ever resolve
+            if not fut.done():
+                fut.cancel()
+            del self._inflight[eld_url]
+
+    async def _get_aio_session(self):
+        """Lazily create the shared aiohttp session on the running event loop"""
+        if self.aio is None or self.aio.closed:
+            self.aio = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+                headers=self._ua_headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.aio
+
+    async def osrm_distance(self, origin_lat, origin_lon, dest_lat, dest_lon):
+        """Calculate driving distance and time using OSRM public API"""
+        try:
+            logger.debug("Calculating OSRM distance from (%s, %s) to (%s, %s)", origin_lat, origin_lon, dest_lat, dest_lon)
+            
+            # Build OSRM API URL
+            osrm_url = (
+                f"http://router.project-osrm.org/route/v1/driving/"
+                f"{origin_lon},{origin_lat};{dest_lon},{dest_lat}"
+                f"?overview=false&alternatives=false&steps=false&annotations=false"
+            )
+
+            # Request OSRM API over the pooled session
+            session = await self._get_aio_session()
+            async with session.get(osrm_url) as response:
+                status = response.status
+                data = orjson.loads(await response.read()) if status == 200 else None
+            if data is not None:
+                if data['routes']:
+                    distance_meters = data['routes'][0]['distance']
+                    duration_seconds = data['routes'][0]['duration']
+                    
+                    # OSRM always returns distance in meters, convert to miles
+                    distance_miles = distance_meters * 0.000621371
+                    # Convert seconds to minutes and hours
+                    duration_minutes = duration_seconds / 60
+                    duration_hours = duration_minutes / 60
+                    
+                    # Format duration text based on hours
+                    if duration_hours >= 1:
+                        duration_text = f"{duration_hours:.1f} hr"
+                    else:
+                        duration_text = f"{duration_minutes:.0f} min"
+                    
+                    logger.debug("OSRM distance calculated: %.2f miles, %.1f hours", distance_miles, duration_hours)
+                    return {
+                        'distance_miles': distance_miles,
+                        'distance_text': f"{distance_miles:.1f} mi",
+                        'duration_text': duration_text,
+                        'duration_minutes': duration_minutes,
+                        'duration_hours': duration_hours,
+                        'method': 'OSRM API'
+                    }
+                else:
+                    logger.warning("OSRM returned no routes")
+            else:
+                logger.error(f"OSRM API returned status code: {status}")
+            return None
+        except Exception as e:
+            logger.error(f"OSRM distance calculation error: {e}")
+            return None
+
+
+    def is_authorized(self, user_id: int) -> bool:
+        """Check if user is authorized to use the bot"""
+        # Allow everyone to use the bot
+        return True
+    
+    def haversine_distance(self, lat1, lon1, lat2, lon2):
+        """Calculate distance between two points using Haversine formula.
+
+        Accepts scalars (returns the usual distance/duration dict) or NumPy
+        arrays of origin coordinates, which are dispatched to the vectorized
+        batch path and return an ndarray of miles."""
+        try:
+            if isinstance(lat1, np.ndarray):
+                return self.haversine_batch(lat1, lon1, lat2, lon2)
+
+            logger.debug("Calculating haversine distance between (%s, %s) and (%s, %s)", lat1, lon1, lat2, lon2)
+
+            # The inner math lives in _haversine_miles, which compiles to
+            # native code when numba is available
+            distance = _haversine_miles(*_to_rad(lat1, lon1), *_to_rad(lat2, lon2))
+
+            # Estimated duration (assuming average speed)
+            avg_speed_mph = 60  # Assuming a default average speed
+            duration_minutes = (distance / avg_speed_mph) * 60
+            duration_hours = duration_minutes / 60
+            logger.debug("Haversine distance calculated: %.2f miles, duration: %.1f hours", distance, duration_hours)
+            return {
+                'distance_miles': distance,
+                'duration_minutes': duration_minutes,
+                'duration_hours': duration_hours
+            }
+        except Exception as e:
+            logger.error(f"Haversine distance calculation error: {e}")
+            return None
+
+    def haversine_batch(self, lats1, lons1, lat2, lon2):
+        """Calculate distances (miles) from many points to one destination in a single
+        vectorized NumPy pass instead of one Python haversine call per driver"""
+        lats1 = np.deg2rad(np.asarray(lats1, dtype=float))
+        lons1 = np.deg2rad(np.asarray(lons1, dtype=float))
+        lat2, lon2 = map(np.deg2rad, (lat2, lon2))
+        dlat = lat2 - lats1
+        dlon = lon2 - lons1
+        a = np.sin(dlat * 0.5) ** 2 + np.cos(lats1) * np.cos(lat2) * np.sin(dlon * 0.5) ** 2
+        return 2 * 3959.0 * np.arcsin(np.sqrt(a))
+
+    @staticmethod
+    def _canon(address: str) -> str:
+        """Canonicalize an address for cache keying so trivially different
+        spellings ('123 Main St , Boston, MA' vs '123 MAIN ST, Boston MA')
+        hit the same cached coordinates"""
+        return _RE_WS.sub(' ', address.upper().strip()).replace(' ,', ',')
+
+    def _cache_geocoding(self, address, lat, lon):
+        """Cache geocoding result in memory and write through to sqlite"""
+        key = self._canon(address)
+        with self.cache_lock:
+            self.geocoding_cache[key] = (lat, lon)
+            self._geo_db.execute(
+                'INSERT OR REPLACE INTO geo (key, lat, lon, ts) VALUES (?, ?, ?, ?)',
+                (key, lat, lon, time.time())
+            )
+            # Location strings are unique per tick for a moving truck, so
+            # expired rows are never overwritten - sweep them daily (the
+            # week-long window itself is far too coarse a cadence)
+            now = time.monotonic()
+            if now - self._geo_prune_ts >= 86400:
+                self._geo_db.execute('DELETE FROM geo WHERE ts < ?', (time.time() - self.geocoding_persist_duration,))
+                self._geo_prune_ts = now
+        logger.debug("Cached geocoding for: %s -> (%s, %s)", address, lat, lon)
+
+    def _get_persistent_geocoding(self, key):
+        """Look up a still-fresh geocoding result in the sqlite store"""
+        with self.cache_lock:
+            row = self._geo_db.execute(
+                'SELECT lat, lon FROM geo WHERE key = ? AND ts > ?',
+                (key, time.time() - self.geocoding_persist_duration)
+            ).fetchone()
+        return row
+
+    def _cache_route(self, route_key, distance_data):
+        """Cache a route result in memory and write through to sqlite so a
+        restart doesn't refetch routes that are still fresh"""
+        with self.cache_lock:
+            self.route_cache[route_key] = distance_data
+            self._geo_db.execute(
+                'INSERT OR REPLACE INTO route (key, data, ts) VALUES (?, ?, ?)',
+                ('|'.join(route_key), orjson.dumps(distance_data), time.time())
+            )
+            # Origin-keyed rows are never overwritten, so sweep expired ones
+            # on the same cadence as the freshness window
+            now = time.monotonic()
+            if now - self._route_prune_ts >= self.route_persist_duration:
+                self._geo_db.execute('DELETE FROM route WHERE ts < ?', (time.time() - self.route_persist_duration,))
+                self._route_prune_ts = now
+
+    def _get_persistent_route(self, route_key):
+        """Look up a still-fresh route result in the sqlite store"""
+        with self.cache_lock:
+            row = self._geo_db.execute(
+                'SELECT data FROM route WHERE key = ? AND ts > ?',
+                ('|'.join(route_key), time.time() - self.route_persist_duration)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    @staticmethod
+    def _rank_nominatim_results(results, housenumber=None):
+        """Pick the best Nominatim result locally instead of issuing more queries.
+        Prefers results whose house number matches, then results that resolved
+        to a road, then the first result."""
+        if not results:
+            return None
+        if housenumber:
+            for result in results:
+                if result.get('address', {}).get('house_number') == housenumber:
+                    return result
+        for result in results:
+            if 'road' in result.get('address', {}):
+                return result
+        return results[0]
+
+    async def geocode_address(self, address):
+        """Get coordinates from address using one structured Nominatim query
+        with a single free-text fallback"""
+        try:
+            logger.debug("Geocoding address: %s", address)
+
+            # Check cache first - single lookup under the canonical key,
+            # expiry handled by TTLCache
+            key = self._canon(address)
+            with self.cache_lock:
+                try:
+                    return self.geocoding_cache[key]
+                except KeyError:
+                    pass
+
+            # Then the durable sqlite store (survives restarts)
+            row = self._get_persistent_geocoding(key)
+            if row is not None:
+                lat, lon = row
+                with self.cache_lock:
+                    self.geocoding_cache[key] = (lat, lon)
+                return lat, lon
+
+            cleaned = ' '.join(address.split())
+            session = await self._get_aio_session()
+
+            # Structured query when the address parses into components -
+            # one request instead of a loop over address variations
+            street_match = _RE_STREET.search(cleaned)
+            if street_match:
+                number, street, city, state = street_match.groups()
+                structured_url = (
+                    f"https://nominatim.openstreetmap.org/search?format=json"
+                    f"&street={number} {street}&city={city}&state={state}"
+                    f"&country=us&limit=5&addressdetails=1"
+                )
+                async with session.get(structured_url) as response:
+                    data = orjson.loads(await response.read()) if response.status == 200 else None
+                best = self._rank_nominatim_results(data, housenumber=number)
+                if best:
+                    lat, lon = float(best['lat']), float(best['lon'])
+                    logger.debug("Structured geocoding successful: (%s, %s) for: %s", lat, lon, cleaned)
+                    self._cache_geocoding(address, lat, lon)
+                    return lat, lon
+
+            # Single free-text query as the fallback
+            freetext_url = (
+                f"https://nominatim.openstreetmap.org/search?q={cleaned}"
+                f"&format=json&limit=5&dedupe=1&countrycodes=us&addressdetails=1"
+            )
+            async with session.get(freetext_url) as response:
+                data = orjson.loads(await response.read()) if response.status == 200 else None
+            best = self._rank_nominatim_results(data)
+            if best:
+                lat, lon = float(best['lat']), float(best['lon'])
+                logger.debug("Free-text geocoding successful: (%s, %s) for: %s", lat, lon, cleaned)
+                self._cache_geocoding(address, lat, lon)
+                return lat, lon
+
+            logger.error(f"All geocoding attempts failed for address: {address}")
+            return None, None
+
+        except Exception as e:
+            logger.error(f"Geocoding error for '{address}': {e}")
+            return None, None
+
+    async def parse_driver_location(self, location_str):
+        """Extract coordinates from driver location string"""
+        try:
+            # For now, we'll use geocoding for the driver location too
+            # In the future, you could extract GPS coordinates directly if available
+            return await self.geocode_address(location_str)
+        except:
+            return None, None
+    
+    def is_distance_valid(self, chat_id, destination, new_distance, driver_location, coords=None):
+        """Validate distance calculation to prevent backtracking issues"""
+        # Quick-reject: compare against a cheap bounding-box estimate first
+        # (degrees-to-miles) so wildly wrong routes are dropped in O(1)
+        # without touching the cache or any network results
+        if coords is not None:
+            origin_lat, origin_lon, dest_lat, dest_lon = coords
+            approx_mi = max(abs(origin_lat - dest_lat) * 69, abs(origin_lon - dest_lon) * 55)
+            if approx_mi > 1 and (approx_mi > new_distance * 3 or approx_mi < new_distance / 3):
+                logger.warning(f"Distance validation failed. Bounding-box estimate: {approx_mi:.1f}, Reported: {new_distance}")
+                return False
+
+        with self.cache_lock:
+            cached_data = self.distance_cache.get((chat_id, destination))
+
+        if cached_data is None:
+            # No previous (unexpired) record, so cache it
+            with self.cache_lock:
+                self.distance_cache[(chat_id, destination)] = _DistanceRecord(new_distance, driver_location)
+            logger.debug("Distance cache set for chat %s to destination %s", chat_id, destination)
+            return True
+
+        cached_distance = cached_data.distance
+        # TTLCache only returns entries younger than 1 minute; if the new
+        # distance is greater than such a fresh entry, invalidate it
+        if new_distance > cached_distance:
+            logger.warning(f"Distance validation failed. Cached: {cached_distance}, New: {new_distance}")
+            return False
+        # Update cache
+        with self.cache_lock:
+            self.distance_cache[(chat_id, destination)] = _DistanceRecord(new_distance, driver_location)
+        logger.debug("Distance cache updated for chat %s to destination %s", chat_id, destination)
+        return True
+
+    async def calculate_distance_and_time(self, origin_address, destination_address, chat_id=None, driver_location=None, dest_coords=None):
+        """Calculate distance and travel time using OSRM and OpenStreetMap"""
+        try:
+            # An offline/error sentinel can never geocode - bail before
+            # sanitizing or queueing any network work
+            if _is_offline_location(origin_address):
+                logger.warning("Offline location passed to distance calculation: %s", origin_address)
+                return None
+            
+            logger.info(f"Calculating distance from '{origin_address}' to '{destination_address}'")
+            
+            # Clean the addresses
+            origin_address = self.sanitize_address(origin_address)
+            destination_address = self.sanitize_address(destination_address)
+            logger.info(f"Sanitized addresses - Origin: '{origin_address}', Destination: '{destination_address}'")
+            
+            # Reuse a fresh result for the same origin/destination before
+            # paying for geocoding and routing again. The key is chat-free
+            # so groups sharing a driver and destination share the result;
+            # backtracking validation still runs per chat on hits
+            route_key = (origin_address, destination_address)
+            with self.cache_lock:
+                cached_route = self.route_cache.get(route_key)
+            if cached_route is None:
+                cached_route = self._get_persistent_route(route_key)
+                if cached_route is not None:
+                    with self.cache_lock:
+                        self.route_cache[route_key] = cached_route
+            if cached_route is not None:
+                logger.debug("Route cache hit for %s", route_key)
+                if chat_id is not None and not self.is_distance_valid(chat_id, destination_address, cached_route['distance_miles'], origin_address):
+                    logger.error("Invalid distance calculation: backtracking or inconsistency detected")
+                    return None
+                return cached_route
+
+            # Use OSRM for driving distance - geocode origin and destination
+            # concurrently so the two network waits overlap. Pre-resolved
+            # destination coordinates (per-group destinations are constant
+            # between ticks) skip the second geocode entirely.
+            logger.info("Using OSRM API for driving distance calculation")
+            if dest_coords is not None:
+                dest_lat, dest_lon = dest_coords
+                origin_lat, origin_lon = await self.geocode_address(origin_address)
+            else:
+                (origin_lat, origin_lon), (dest_lat, dest_lon) = await asyncio.gather(
+                    self.geocode_address(origin_address),
+                    self.geocode_address(destination_address)
+                )
+            
+            if origin_lat is None or dest_lat is None:
+                logger.error("Failed to geocode one or both addresses")
+                if origin_lat is None:
+                    logger.error(f"❌ Could not geocode origin address: '{origin_address}'")
+                if dest_lat is None:
+                    logger.error(f"❌ Could not geocode destination address: '{destination_address}'")
+                return None
+            
+            osrm_result = await self.osrm_distance(origin_lat, origin_lon, dest_lat, dest_lon)
+            if osrm_result is not None:
+                # Validate distance value
+                if chat_id is not None and not self.is_distance_valid(chat_id, destination_address, osrm_result['distance_miles'], origin_address, coords=(origin_lat, origin_lon, dest_lat, dest_lon)):
+                    logger.error("Invalid distance calculation: backtracking or inconsistency detected")
+                    return None
+                self._cache_route(route_key, osrm_result)
+                return osrm_result
+            
+            # Fallback to haversine calculation
+            logger.info("🔄 Using fallback haversine calculation (straight-line distance)")
+            haversine_result = self.haversine_distance(origin_lat, origin_lon, dest_lat, dest_lon)
+            if haversine_result is None:
+                logger.error("Haversine distance calculation failed")
+                return None
+            
+            distance = haversine_result['distance_miles']
+            duration_minutes = haversine_result['duration_minutes']
+            duration_hours = haversine_result['duration_hours']
+            
+            # Validate distance value
+            if chat_id is not None and not self.is_distance_valid(chat_id, destination_address, distance, origin_address, coords=(origin_lat, origin_lon, dest_lat, dest_lon)):
+                logger.error("Invalid distance calculation: backtracking or inconsistency detected")
+                return None
+            
+            logger.info(f"✅ Haversine calculation successful: {distance:.1f} miles (straight-line)")
+            
+            # Format duration text based on hours
+            if duration_hours >= 1:
+                duration_text = f"{duration_hours:.1f} hr (estimated)"
+            else:
+                duration_text = f"{duration_minutes:.0f} min (estimated)"
+            
+            # Add note about the calculation method
+            fallback_method = "Haversine (straight-line) - OSRM API unavailable"
+            
+            result = {
+                'distance_miles': distance,
+                'distance_text': f"{distance:.1f} mi (straight-line)",
+                'duration_text': duration_text,
+                'duration_minutes': duration_minutes,
+                'duration_hours': duration_hours,
+                'method': fallback_method
+            }
+            self._cache_route(route_key, result)
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error in calculate_distance_and_time: {e}")
+            return None
+
+    def load_drivers_config(self):
+        """Load drivers configuration from JSON file"""
+        try:
+            # Skip the reparse when the file hasn't changed since the last
+            # successful load - reloads on hot paths become a stat() call
+            st = os.stat(self.drivers_config_file)
+            if st.st_mtime == self._drivers_config_mtime and getattr(self, 'drivers_config', None):
+                return self.drivers_config
+            with open(self.drivers_config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+            self._drivers_config_mtime = st.st_mtime
+            logger.info(f"Loaded {len(config.get('drivers', []))} drivers from configuration")
+            return config
+        except FileNotFoundError:
+            logger.warning(f"Drivers config file {self.drivers_config_file} not found. Creating empty config.")
+            return {'drivers': []}
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {self.drivers_config_file}: {e}")
+            return {'drivers': []}
+        except Exception as e:
+            logger.error(f"Error loading drivers config: {e}")
+            return {'drivers': []}
+
+    def _config_flush_loop(self):
+        """Background writer that folds bursts of config changes into one write"""
+        while True:
+            self._config_dirty.wait()
+            time.sleep(2)  # let a burst of changes settle before writing
+            self._config_dirty.clear()
+            self._write_drivers_config()
+
+    def _write_drivers_config(self):
+        """Atomically write the drivers configuration to disk"""
+        try:
+            tmp_path = self.drivers_config_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self.drivers_config, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.drivers_config_file)
+            logger.info("Drivers configuration saved successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving drivers config: {e}")
+            return False
+
+    def _rebuild_driver_index(self):
+        """Rebuild the lowercase name -> driver index used for O(1) lookups"""
+        self._driver_by_name_lower = {
+            d['name'].lower(): d for d in self.drivers_config.get('drivers', [])
+        }
+
+    def save_drivers_config(self):
+        """Queue a drivers-config save; the background writer debounces bursts.
+        The in-memory config is already updated, so this always succeeds from
+        the caller's point of view - write failures are logged by the writer."""
+        self._config_dirty.set()
+        return True
+    
+    def get_driver_by_chat_id(self, chat_id):
+        """Get driver configuration for a specific chat ID"""
+        return self.chat_to_driver.get(str(chat_id))
+    
+    def get_eld_url_for_group(self, chat_id):
+        """Get the ELD URL for a given Telegram group ID."""
+        # First check if there's a specific driver mapped to this chat
+        driver = self.get_driver_by_chat_id(chat_id)
+        if driver:
+            logger.info(f"🎯 Found driver mapping for chat {chat_id}: {driver['name']} (Unit: {driver['unit_number']})")
+            return driver['eld_url']
+        
+        # Log warning if no driver is assigned to this group
+        logger.warning(f"⚠️ No driver assigned to chat {chat_id}. Use /setdriver [driver_name] to assign a driver.")
+        
+        # Return None instead of default ELD_URL to force proper assignment
+        return None
+    
+    def set_driver_for_group(self, chat_id, driver_name):
+        """Set which driver to track for a specific group"""
+        # Find the driver by name via the prebuilt index
+        driver = self._driver_by_name_lower.get(driver_name.lower())
+
+        if not driver:
+            return False, f"Driver '{driver_name}' not found in configuration"
+        
+        # Check if this driver is already assigned to another group
+        if driver.get('telegram_group_id') and driver['telegram_group_id'] != chat_id:
+            old_chat_id = driver['telegram_group_id']
+            logger.info(f"🔄 Driver {driver['name']} reassigned from chat {old_chat_id} to chat {chat_id}")
+            # Remove old mapping
+            if str(old_chat_id) in self.chat_to_driver:
+                del self.chat_to_driver[str(old_chat_id)]
+        
+        # Check if this group already has a different driver assigned
+        if str(chat_id) in self.chat_to_driver:
+            old_driver = self.chat_to_driver[str(chat_id)]
+            if old_driver['name'] != driver['name']:
+                # Clear the old driver's assignment
+                old_driver['telegram_group_id'] = None
+                logger.info(f"🔄 Group {chat_id} reassigned from driver {old_driver['name']} to {driver['name']}")
+        
+        # Update the driver's telegram_group_id
+        driver['telegram_group_id'] = chat_id
+        
+        # Update the chat_to_driver mapping
+        self.chat_to_driver[str(chat_id)] = driver
+        
+        # Save the configuration
+        if self.save_drivers_config():
+            logger.info(f"✅ Successfully linked chat {chat_id} to driver {driver['name']} (Unit: {driver['unit_number']})")
+            return True, f"Group linked to driver {driver['name']} (Unit: {driver['unit_number']})"
+        else:
+            return False, "Failed to save configuration"
+    
+    def list_available_drivers(self):
+        """Get a list of all available drivers"""
+        drivers = []
+        for driver in self.drivers_config.get('drivers', []):
+            drivers.append({
+                'name': driver['name'],
+                'unit_number': driver['unit_number'],
+                'assigned_group': driver.get('telegram_group_id', None)
+            })
+        return drivers
+    
+    def add_new_driver(self, name, unit_number, eld_url):
+        """Add a new driver to the configuration"""
+        try:
+            # Check if driver with this name already exists
+            if name.lower() in self._driver_by_name_lower:
+                return False, f"Driver '{name}' already exists"
+            
+            # Check if unit number already exists
+            for driver in self.drivers_config.get('drivers', []):
+                if driver['unit_number'].lower() == unit_number.lower():
+                    return False, f"Unit number '{unit_number}' is already taken"
+            
+            # Validate ELD URL format
+            if not eld_url.startswith('https://state-eld.us/shared-driver-link/'):
+                return False, "Invalid ELD URL format. Must start with 'https://state-eld.us/shared-driver-link/'"
+            
+            # Add new driver
+            new_driver = {
+                'name': name,
+                'unit_number': unit_number,
+                'eld_url': eld_url,
+                'telegram_group_id': None
+            }
+            
+            if 'drivers' not in self.drivers_config:
+                self.drivers_config['drivers'] = []
+            
+            self.drivers_config['drivers'].append(new_driver)
+            self._driver_by_name_lower[name.lower()] = new_driver
+            
+            # Save configuration
+            if self.save_drivers_config():
+                logger.info(f"✅ Added new driver: {name} (Unit: {unit_number})")
+                return True, f"Driver '{name}' (Unit: {unit_number}) added successfully"
+            else:
+                # Remove from memory if save failed
+                self.drivers_config['drivers'].pop()
+                del self._driver_by_name_lower[name.lower()]
+                return False, "Failed to save configuration"
+                
+        except Exception as e:
+            logger.error(f"Error adding driver: {e}")
+            return False, f"Error adding driver: {str(e)}"
+    
+    def remove_driver(self, driver_name):
+        """Remove a driver from the configuration"""
+        try:
+            # Find the driver
+            driver_index = None
+            driver_to_remove = None
+            for i, driver in enumerate(self.drivers_config.get('drivers', [])):
+                if driver['name'].lower() == driver_name.lower():
+                    driver_index = i
+                    driver_to_remove = driver
+                    break
+            
+            if driver_index is None:
+                return False, f"Driver '{driver_name}' not found"
+            
+            # Remove from chat mapping if assigned
+            if driver_to_remove.get('telegram_group_id'):
+                chat_id = str(driver_to_remove['telegram_group_id'])
+                if chat_id in self.chat_to_driver:
+                    del self.chat_to_driver[chat_id]
+                    logger.info(f"Removed driver mapping for chat {chat_id}")
+            
+            # Remove from configuration
+            removed_driver = self.drivers_config['drivers'].pop(driver_index)
+            self._driver_by_name_lower.pop(removed_driver['name'].lower(), None)
+            
+            # Save configuration
+            if self.save_drivers_config():
+                logger.info(f"✅ Removed driver: {removed_driver['name']} (Unit: {removed_driver['unit_number']})")
+                return True, f"Driver '{removed_driver['name']}' removed successfully"
+            else:
+                # Restore if save failed
+                self.drivers_config['drivers'].insert(driver_index, removed_driver)
+                self._driver_by_name_lower[removed_driver['name'].lower()] = removed_driver
+                return False, "Failed to save configuration"
+                
+        except Exception as e:
+            logger.error(f"Error removing driver: {e}")
+            return False, f"Error removing driver: {str(e)}"
+    
+    def edit_driver(self, driver_name, field, new_value):
+        """Edit a driver's information"""
+        try:
+            # Find the driver via the prebuilt index
+            driver = self._driver_by_name_lower.get(driver_name.lower())
+            
+            if not driver:
+                return False, f"Driver '{driver_name}' not found"
+            
+            old_value = driver.get(field, 'N/A')
+            
+            # Validate field and value
+            if field == 'name':
+                # Check if new name conflicts with existing drivers
+                existing = self._driver_by_name_lower.get(new_value.lower())
+                if existing is not None and existing is not driver:
+                    return False, f"Driver name '{new_value}' already exists"
+                del self._driver_by_name_lower[driver['name'].lower()]
+                driver['name'] = new_value
+                self._driver_by_name_lower[new_value.lower()] = driver
+            elif field == 'unit_number':
+                # Check if new unit number conflicts
+                for d in self.drivers_config.get('drivers', []):
+                    if d != driver and d['unit_number'].lower() == new_value.lower():
+                        return False, f"Unit number '{new_value}' is already taken"
+                driver['unit_number'] = new_value
+            elif field == 'eld_url':
+                if not new_value.startswith('https://state-eld.us/shared-driver-link/'):
+                    return False, "Invalid ELD URL format. Must start with 'https://state-eld.us/shared-driver-link/'"
+                driver['eld_url'] = new_value
+            else:
+                return False, f"Invalid field '{field}'. Valid fields: name, unit_number, eld_url"
+            
+            # Update chat mapping if driver name changed
+            if field == 'name' and driver.get('telegram_group_id'):
+                chat_id = str(driver['telegram_group_id'])
+                if chat_id in self.chat_to_driver:
+                    self.chat_to_driver[chat_id] = driver
+            
+            # Save configuration
+            if self.save_drivers_config():
+                logger.info(f"✅ Updated driver {driver_name}: {field} changed from '{old_value}' to '{new_value}'")
+                return True, f"Driver {field} updated from '{old_value}' to '{new_value}'"
+            else:
+                # Restore old value if save failed
+                driver[field] = old_value
+                return False, "Failed to save configuration"
+                
+        except Exception as e:
+            logger.error(f"Error editing driver: {e}")
+            return False, f"Error editing driver: {str(e)}"
+    
+    def get_driver_info(self, driver_name):
+        """Get detailed information about a driver"""
+        return self._driver_by_name_lower.get(driver_name.lower())
+    
+    def _cache_shard(self, cache_key):
+        """Select the (cache, lock) shard responsible for a key"""
+        return self.cache_shards[hash(cache_key) & 7]
+
+    def get_cached_data(self, cache_key):
+        """Get cached data if it's still valid (TTLCache expires entries itself)"""
+        cache, lock = self._cache_shard(cache_key)
+        with lock:
+            try:
+                data = cache[cache_key]
+            except KeyError:
+                return None
+        logger.debug("Cache hit for %s", cache_key)
+        return data
+    
+    def set_cached_data(self, cache_key, data):
+        """Set cached data (expiry stamped by TTLCache)"""
+        cache, lock = self._cache_shard(cache_key)
+        with lock:
+            cache[cache_key] = data
+        logger.debug("Cache set for %s", cache_key)
+    
+    def get_driver_status(self, driver_data):
+        """Determine driver status based on speed"""
+        # Extract speed value from speed string (e.g., "65.2 mph" -> 65.2).
+        # Validate with str methods up front instead of raising/catching
+        # ValueError on the common 'N/A'/'Error' sentinels.
+        speed_str = driver_data.get('speed', '0 mph')
+        numeric = speed_str.partition(' ')[0].replace(',', '') if isinstance(speed_str, str) else ''
+        if not numeric.replace('.', '', 1).isdigit():
+            return "❓ Unknown", 0
+
+        speed_value = float(numeric)
+        if speed_value > 0:
+            return "🚗 Driving", speed_value
+        return "🛑 Stopped", speed_value
+    
+    def track_driver_stop_time(self, eld_url, driver_data):
+        """Track how long a driver has been stopped"""
+        try:
+            status, speed = self.get_driver_status(driver_data)
+            current_time = time.monotonic()
+            current_location = driver_data.get('location', 'Unknown')
+            
+            if speed == 0:  # Driver is stopped
+                if eld_url not in self.driver_stop_times:
+                    # First time we see this driver stopped
+                    self.driver_stop_times[eld_url] = {
+                        'stopped_since': current_time,
+                        'location': current_location,
+                        'notified': False
+                    }
+                    logger.info(f"Driver started stopping at {current_time}")
+                else:
+                    # Update location but keep the original stop time
+                    self.driver_stop_times[eld_url]['location'] = current_location
+            else:  # Driver is moving
+                if eld_url in self.driver_stop_times:
+                    # Driver started moving again, clear the stop time
+                    del self.driver_stop_times[eld_url]
+                    logger.info(f"Driver started moving again")
+            
+            return self.driver_stop_times.get(eld_url)
+        except Exception as e:
+            logger.error(f"Error tracking driver stop time: {e}")
+            return None
+    
+    def check_extended_stop(self, eld_url):
+        """Check if driver has been stopped for more than 45 minutes"""
+        if eld_url not in self.driver_stop_times:
+            return False, None
+        
+        stop_info = self.driver_stop_times[eld_url]
+        stop_duration = time.monotonic() - stop_info['stopped_since']
+        
+        if stop_duration >= self.extended_stop_threshold and not stop_info['notified']:
+            # The caller flips 'notified' once the alert is actually sent -
+            # flipping it here would eat the one-shot alert whenever the
+            # tick bails out between this check and the send
+            stop_duration_minutes = int(stop_duration // 60)
+            return True, stop_duration_minutes
+        
+        return False, None
+
+    def compute_stop_state(self, eld_url, driver_data):
+        """Track the stop and evaluate the extended-stop alert in one pass.
+
+        Returns (stop_info, extended_stop, stop_minutes); both underlying
+        checks share the stop-times dict, so folding them avoids parsing
+        the speed twice per tick. All state is in-memory monotonic floats,
+        so this stays on the event loop - there is no I/O to offload."""
+        stop_info = self.track_driver_stop_time(eld_url, driver_data)
+        extended_stop, stop_minutes = self.check_extended_stop(eld_url)
+        return stop_info, extended_stop, stop_minutes
+
+    # Shared flag list for every pooled Chrome instance - built once instead
+    # of appending ~10 arguments per Options() construction. Skipping
+    # images/stylesheets cuts page bytes sharply.
+    _CHROME_FLAGS = (
+        '--headless=new',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-logging',
+        '--disable-extensions',
+        '--blink-settings=imagesEnabled=false',
+        '--window-size=1280,720',
+    )
+    _CHROME_PREFS = {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.stylesheets': 2
+    }
+
+    def _create_pooled_driver(self):
+        """Create a headless Chrome instance configured for the pool"""
+        chrome_options = Options()
+        for flag in self._CHROME_FLAGS:
+            chrome_options.add_argument(flag)
+        # Dedicated profile dir per instance keeps the browser cache warm
+        # across scrapes
+        chrome_options.add_argument(f"--user-data-dir={tempfile.mkdtemp(prefix='eld_')}")
+        chrome_options.add_experimental_option('prefs', self._CHROME_PREFS)
+        chrome_options.page_load_strategy = 'eager'
+
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(15)
+        # No implicit wait: the selector probe loops expect find_element to
+        # raise immediately on a miss, and a global 3s implicit wait would
+        # turn each missed probe into a 3s stall
+        return driver
+
+    @contextmanager
+    def borrow_driver(self):
+        """Borrow a Chrome instance from the pool, creating one lazily if the
+        pool is below capacity. Broken instances are quit and replaced instead
+        of being returned to the pool."""
+        try:
+            driver = self.driver_pool.get_nowait()
+        except queue.Empty:
+            with self._driver_pool_lock:
+                if self._driver_pool_created < self.driver_pool_size:
+                    self._driver_pool_created += 1
+                    create_new = True
+                else:
+                    create_new = False
+            if create_new:
+                try:
+                    driver = self._create_pooled_driver()
+                except Exception:
+                    with self._driver_pool_lock:
+                        self._driver_pool_created -= 1
+                    raise
+            else:
+                # Pool is at capacity - wait for an instance to be returned
+                driver = self.driver_pool.get()
+
+        try:
+            yield driver
+        except WebDriverException:
+            # Recycle the broken instance; the next borrow creates a fresh one
+            logger.warning("Recycling broken Chrome instance from pool")
+            with self._driver_pool_lock:
+                self._driver_pool_created -= 1
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            raise
+        else:
+            # Clear session state so the next borrower starts clean
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                pass
+            self.driver_pool.put(driver)
+
+    def shutdown_driver_pool(self):
+        """Drain the pool and quit every pooled Chrome instance"""
+        while True:
+            try:
+                driver = self.driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            with self._driver_pool_lock:
+                self._driver_pool_created -= 1
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    async def _extract_driver_data_http_async(self, eld_url):
+        """Fetch driver data straight from the backend JSON endpoint on the
+        event loop over the shared aiohttp session, skipping the browser.
+        Returns None when no endpoint is configured or the call fails, so
+        callers can fall back to Selenium."""
+        if not self.eld_api_template:
+            return None
+        try:
+            token = eld_url.rstrip('/').split('/')[-1]
+            api_url = self.eld_api_template.format(token=token)
+            session = await self._get_aio_session()
+            async with session.get(api_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
+                    logger.warning("ELD API returned %s, falling back to Selenium", response.status)
+                    return None
+                data = orjson.loads(await response.read())
+
+            speed = data.get('speed')
+            driver_data = {
+                'name': data.get('name') or 'N/A',
+                'speed': f"{float(speed):.1f} mph" if speed is not None else 'N/A',
+                'location': data.get('location') or 'N/A',
+                'truck_number': data.get('truck_number') or data.get('truckNumber') or 'N/A'
+            }
+            logger.debug("Extracted driver data via JSON API: %s", driver_data)
+            return driver_data
+        except Exception as e:
+            logger.warning("ELD API extraction failed (%s), falling back to Selenium", e)
+            return None
+
+    def _extract_selenium_only(self, eld_url):
+        """Selenium extraction with concurrency control, for callers that
+        already tried the JSON API on the event loop"""
+        with self.selenium_semaphore:
+            return self.extract_driver_data_fast(eld_url)
+    
+    def extract_driver_data_fast(self, eld_url):
+        """Fast extraction using a pooled Chrome instance"""
+        try:
+            try:
+                with self.borrow_driver() as driver:
+                    return self._scrape_eld_page(driver, eld_url)
+            except WebDriverException:
+                # The broken instance was recycled - retry once on a fresh one
+                with self.borrow_driver() as driver:
+                    return self._scrape_eld_page(driver, eld_url)
+        except Exception as e:
+            logger.error(f"Error in extract_driver_data_fast: {e}")
+            return {
+                'name': 'Error',
+                'speed': 'Error',
+                'location': 'Error extracting data'
+            }
+
+    def _scrape_eld_page(self, driver, eld_url):
+        """Extract the driver data fields from the ELD page using a live Chrome instance"""
+        # Navigate to ELD page
+        driver.get(eld_url)
+        
+        # Wait for the React app to render the data fields. A bounded wait on
+        # the actual sentinel text beats a fixed sleep: fast loads proceed in
+        # ~1s while slow ones still get the full cap. The default 500ms poll
+        # interval can leave the scrape idle long after the DOM is ready, so
+        # poll every 100ms instead.
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.body.innerText.includes('Name')")
+            )
+        except:
+            # Timed out - continue with whatever text exists
+            pass
+        
+        # Initialize driver data
+        driver_data = {
+            'name': 'N/A',
+            'speed': 'N/A',
+            'location': 'N/A',
+            'truck_number': 'N/A'
+        }
+        found = set()
+
+        # Targeted DOM query first - a ~200-byte dict crosses the CDP
+        # boundary instead of the whole page text
+        try:
+            dom_data = driver.execute_script(_ELD_FIELDS_JS)
+        except Exception as e:
+            logger.debug("DOM field extraction failed: %s", e)
+            dom_data = None
+
+        if dom_data:
+            name_text = (dom_data.get('name') or '').strip()
+            if name_text:
+                driver_data['name'] = name_text
+                found.add('name')
+
+            speed_text = (dom_data.get('speed') or '').strip()
+            if speed_text.upper() == 'N/A':
+                driver_data['speed'] = 'N/A'
+                found.add('speed')
+            elif speed_text:
+                speed_match = _RE_MPH.search(speed_text)
+                if speed_match:
+                    driver_data['speed'] = f"{float(speed_match.group(1)):.1f} mph"
+                    found.add('speed')
+
+            location_text = (dom_data.get('location') or '').strip()
+            if location_text:
+                # Check if it's just "Open in Google Maps" (no real location)
+                if 'Open in Google Maps' in location_text or location_text.lower() in ['n/a', 'not available', 'offline']:
+                    driver_data['location'] = 'Location not available (driver may be offline)'
+                else:
+                    driver_data['location'] = location_text
+                found.add('loc')
+
+            truck_text = (dom_data.get('truck_number') or '').strip()
+            if truck_text:
+                driver_data['truck_number'] = truck_text
+                found.add('truck')
+
+        if len(found) == 4:
+            logger.info(f"Extracted driver data: {driver_data}")
+            return driver_data
+
+        # Fall back to the regex scan over the page text for missing fields
+        page_text = driver.execute_script("return document.body.innerText;")
+
+        # Single pass over the page text - one alternation fills all four
+        # fields (first win per field) instead of up to 12 full scans
+        for match in _ELD_COMBINED.finditer(page_text):
+            group = match.lastgroup
+            field = 'speed' if group == 'mph' else group
+            if field in found:
+                continue
+            found.add(field)
+
+            if field == 'speed':
+                raw = match.group(group).strip()
+                if raw.upper() == 'N/A':
+                    driver_data['speed'] = 'N/A'
+                else:
+                    driver_data['speed'] = f"{float(raw):.1f} mph"
+            elif field == 'name':
+                name_text = match.group('name').strip()
+                if name_text and len(name_text) > 0:
+                    driver_data['name'] = name_text
+                else:
+                    driver_data['name'] = 'No driver name available'
+            elif field == 'loc':
+                location_text = match.group('loc').strip()
+                # Check if it's just "Open in Google Maps" (no real location)
+                if 'Open in Google Maps' in location_text or location_text.lower() in ['n/a', 'not available', 'offline']:
+                    driver_data['location'] = 'Location not available (driver may be offline)'
+                else:
+                    driver_data['location'] = location_text
+            elif field == 'truck':
+                truck_text = match.group('truck').strip()
+                if truck_text and len(truck_text) > 0:
+                    driver_data['truck_number'] = truck_text
+
+            if len(found) == 4:
+                break
+        
+        # Log the extracted data for debugging
+        logger.info(f"Extracted driver data: {driver_data}")
+        
+        return driver_data
+
+    def extract_driver_data(self, eld_url):
+        """Extract driver data from ELD page using Selenium"""
+        try:
+            # Borrow a pooled Chrome instance instead of cold-starting one
+            with self.borrow_driver() as driver:
+                # Navigate to ELD page
+                driver.get(eld_url)
+                
+                # Use WebDriverWait for better performance
+                try:
+                    WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
+                except:
+                    pass  # Continue if timeout
+                
+                # Initialize driver data
+                driver_data = {
+                    'name': 'N/A',
+                    'speed': 'N/A',
+                    'location': 'N/A'
+                }
+                
+                # Reduced wait time for dynamic content
+                time.sleep(1)
+                
+                # Get page text directly using Python (much faster) - when
+                # this succeeds the CSS-selector probes below are skipped
+                try:
+                    page_text = driver.execute_script("return document.body.innerText;")
+                    
+                    # Extract speed using Python regex (handle both integer and decimal)
+                    speed_match = _RE_MPH.search(page_text)
+                    if speed_match:
+                        speed_val = float(speed_match.group(1))
+                        driver_data['speed'] = f"{speed_val:.1f} mph"
+                    
+                    # Extract name (between 'Name' and 'Truck Number')
+                    name_match = _NAME_RE.search(page_text)
+                    if name_match:
+                        driver_data['name'] = name_match.group(1).strip()
+                    
+                    # Extract location (after 'Current Location')
+                    location_match = _LOC_RE.search(page_text)
+                    if location_match:
+                        driver_data['location'] = location_match.group(1).strip()
+                    
+                except Exception as e:
+                    logger.error(f"Fast extraction failed: {e}")
+                
+                # Probe CSS selectors only for fields innerText couldn't fill -
+                # each probe is a find_element round-trip, so skip them on success
+                if driver_data['name'] == 'N/A':
+                    name_selectors = [
+                        '[data-testid="driver-name"]',
+                        '.driver-name',
+                        '#driver-name',
+                        '.name',
+                        '#name'
+                    ]
+                    
+                    for selector in name_selectors:
+                        try:
+                            element = driver.find_element(By.CSS_SELECTOR, selector)
+                            if element and element.text:
+                                driver_data['name'] = element.text.strip()
+                                break
+                        except:
+                            continue
+                
+                if driver_data['speed'] == 'N/A':
+                    speed_selectors = [
+                        '[data-testid="speed"]',
+                        '.speed',
+                        '#speed',
+                        '.velocity',
+                        '#velocity'
+                    ]
+                    
+                    for selector in speed_selectors:
+                        try:
+                            element = driver.find_element(By.CSS_SELECTOR, selector)
+                            if element and element.text:
+                                speed_text = element.text.strip()
+                                speed_match = _RE_MPH.search(speed_text)
+                                if speed_match:
+                                    driver_data['speed'] = f"{speed_match.group(1)} mph"
+                                    break
+                        except:
+                            continue
+                
+                if driver_data['location'] == 'N/A':
+                    location_selectors = [
+                        '[data-testid="location"]',
+                        '.location',
+                        '#location',
+                        '.address',
+                        '#address'
+                    ]
+                    
+                    for selector in location_selectors:
+                        try:
+                            element = driver.find_element(By.CSS_SELECTOR, selector)
+                            if element and element.text:
+                                driver_data['location'] = element.text.strip()
+                                break
+                        except:
+                            continue
+                
+                # Fallback: try simple text extraction if JavaScript failed
+                if driver_data['name'] == 'N/A' or driver_data['speed'] == 'N/A' or driver_data['location'] == 'N/A':
+                    try:
+                        page_text = driver.execute_script("return document.body.innerText;")
+                        
+                        # Simple fallback patterns
+                        if driver_data['name'] == 'N/A':
+                            name_match = _RE_NAME_SIMPLE.search(page_text)
+                            if name_match:
+                                driver_data['name'] = name_match.group(1).strip()
+                        
+                        if driver_data['speed'] == 'N/A':
+                            speed_match = _RE_MPH_DEC.search(page_text)
+                            if speed_match:
+                                speed_val = float(speed_match.group(1))
+                                driver_data['speed'] = f"{speed_val:.1f} mph"
+                        
+                        if driver_data['location'] == 'N/A':
+                            location_match = _LOC_RE.search(page_text)
+                            if location_match:
+                                driver_data['location'] = location_match.group(1).strip()
+                    
+                    except Exception as e:
+                        logger.error(f"Fallback extraction failed: {e}")
+                
+                return driver_data
+
+        except Exception as e:
+            logger.error(f"Error in extract_driver_data: {e}")
+            return {
+                'name': 'Error',
+                'speed': 'Error',
+                'location': 'Error extracting data'
+            }
+    
+    def sanitize_address(self, address):
+        """Clean and sanitize address for geocoding"""
+        if not address or address.strip() == '':
+            return ''
+        
+        # Remove trailing non-alphabetic characters and excessive whitespace
+        address = address.strip()
+        address = _SANITIZE_TAIL.sub('', address)
+        address = _RE_WS.sub(' ', address)
+        
+        # Remove common problematic phrases
+        address = _RE_GMAPS_NOTE.sub('', address)
+        address = _RE_NO_LOCATION.sub('', address)
+        address = address.strip()
+        
+        logger.debug("Sanitized address: '%s'", address)
+        return address
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def shorten_location(location):
+        """Shorten location to extract county, state, and zip code in the format: County, State, ZIP
+
+        Pure string -> string, so results are memoized: the same raw driver
+        location recurs across commands and auto-updates while the scrape
+        cache is warm, and repeats cost a dict hit instead of a regex sweep"""
+        if not location or location == 'N/A':
+            return location
+
+        # Already in the short "City, ST"-style shape the patterns below
+        # produce - skip the regex sweep for the common case
+        if len(location) <= 40 and location.count(',') <= 2:
+            return location
+
+        try:
+            # Patterns to extract county, state, and zip from full address
+            # Example: "3292, Rennie Smith Drive, South Chicago Heights, Bloom Township, Cook County, Illinois, 60411, United States"
+            # Expected output: "Cook County, Illinois, 60411"
+            for pattern in _SHORTEN_PATTERNS:
+                match = pattern.search(location)
+                if match:
+                    location_part = match.group(1).strip()
+                    state = match.group(2).strip()
+                    zip_code = match.group(3).strip()
+                    
+                    # Clean up location part (remove extra spaces and unwanted characters)
+                    location_clean = _RE_WS.sub(' ', location_part).strip()
+                    
+                    # Zero-allocation fast path for the usual uppercase
+                    # 2-letter code; one hash probe otherwise
+                    if len(state) == 2 and state.isupper():
+                        state_abbrev = state
+                    else:
+                        state_abbrev = _STATE_LOOKUP.get(state.lower(), state.upper())
+                    
+                    if location_clean and len(location_clean) > 0:
+                        return f"{location_clean}, {state_abbrev}, {zip_code}"
+            
+            # No comma means neither fallback shape can match - go straight
+            # to the truncation fallback without splitting
+            if ',' not in location:
+                return location[:50] + "..." if len(location) > 50 else location
+
+            # If no pattern matches, try to extract just city and state.
+            # The shape is a plain comma-delimited tail, so a C-level split
+            # replaces the two backtracking fallback regexes
+            parts = [p.strip() for p in location.split(',') if p.strip()]
+            if parts and parts[-1].lower() in ('united states', 'usa'):
+                parts.pop()
+            if len(parts) >= 2:
+                state = parts[-1]
+                head, _, tail = state.partition(' ')
+                if tail and tail.replace('-', '').isdigit():
+                    # "IL 60411"-style token - drop the trailing ZIP
+                    state = head
+                if (len(state) == 2 and state.isupper()) or state.isalpha():
+                    if len(state) == 2 and state.isupper():
+                        state_abbrev = state
+                    else:
+                        state_abbrev = _STATE_LOOKUP.get(state.lower(), state.upper())
+                    city_clean = _RE_WS.sub(' ', parts[-2]).strip()
+                    if city_clean:
+                        return f"{city_clean}, {state_abbrev}"
+            
+            # Final fallback - return first 50 characters
+            return location[:50] + "..." if len(location) > 50 else location
+            
+        except Exception as e:
+            logger.error(f"Error shortening location: {e}")
+            return location
+
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        await update.message.reply_text(_WELCOME_MESSAGE, parse_mode='Markdown')
+    
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /help command"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        await update.message.reply_text(_HELP_MESSAGE, parse_mode='Markdown')
+    
+    async def _set_group_destination(self, chat_id, destination):
+        """Remember a group's destination and pre-resolve its coordinates.
+        The geocode is usually a cache hit since the destination was just
+        routed to; ticks then reuse the coordinates instead of re-geocoding
+        the same string every cycle."""
+        self.group_destinations[chat_id] = destination
+        self._dest_version[chat_id] = self._dest_version.get(chat_id, 0) + 1
+        lat, lon = await self.geocode_address(self.sanitize_address(destination))
+        if lat is not None:
+            self.group_dest_coords[chat_id] = (lat, lon)
+        else:
+            # Never leave the previous destination's coordinates behind -
+            # ticks would silently route to the old place under the new
+            # name. With no entry they geocode the string and fail loudly.
+            self.group_dest_coords.pop(chat_id, None)
+
+    async def _fetch_driver_context(self, chat_id, status_task):
+        """Shared command prelude: resolve the group's ELD URL, fetch driver
+        data (cache first, scrape on miss), and compute driver status and
+        stop tracking. `status_task` is the still-in-flight "processing"
+        reply so the Telegram round-trip overlaps the scrape; it is only
+        awaited here on the error path. Returns (eld_url, driver_data,
+        speed_value, stop_info) or None after reporting the missing-driver
+        error to the chat."""
+        eld_url = self.get_eld_url_for_group(chat_id)
+
+        # Check if no driver is assigned to this group
+        if eld_url is None:
+            status_message = await status_task
+            await status_message.edit_text(_NO_DRIVER_ASSIGNED_MSG, parse_mode='Markdown')
+            return None
+
+        logger.info(f"📍 Using ELD URL: {eld_url}")
+
+        # Include chat_id in cache key to avoid collisions when multiple drivers share the same ELD URL
+        cache_key = f"location_{chat_id}_{eld_url}"
+
+        # Serialize per chat so repeated commands keep their order, then
+        # check cache before paying for a scrape
+        async with self._chat_lock(chat_id):
+            driver_data = self.get_cached_data(cache_key)
+
+            if driver_data is None:
+                # Run extraction in thread pool, coalescing with any
+                # in-flight scrape of the same page
+                driver_data = await self._extract_coalesced(eld_url)
+                # Cache the result
+                self.set_cached_data(cache_key, driver_data)
+
+        # Get driver status and track stop time
+        driver_status, speed_value = self.get_driver_status(driver_data)
+        stop_info = self.track_driver_stop_time(eld_url, driver_data)
+        return eld_url, driver_data, speed_value, stop_info
+
+    async def location_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /location command"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        # Send "fetching data" message concurrently with the fetch below -
+        # the Telegram round-trip overlaps the scrape instead of preceding it
+        status_task = asyncio.create_task(
+            update.message.reply_text("🔄 Fetching driver location data...")
+        )
+        
+        try:
+            ctx = await self._fetch_driver_context(chat_id, status_task)
+            if ctx is None:
+                return
+            eld_url, driver_data, speed_value, stop_info = ctx
+            status_message = await status_task
+
+            # Check if driver is offline
+            is_offline = _is_offline_location(driver_data['location'])
+            
+            display_location = driver_data['location']
+            offline_warning = ""
+            
+            if is_offline:
+                offline_warning = "\n⚠️ **Status:** Driver offline - location not available"
+            
+            # Determine status icon based on speed
+            if is_offline:
+                status_icon = "🔴"
+                status_text = "Offline"
+            else:
+                status_icon = "🟢" if speed_value > 0 else "🔴"
+                status_text = "Driving" if speed_value > 0 else "Stopped"
+            
+            # Shorten location to city/state if it's too long
+            short_location = self.shorten_location(display_location) if not is_offline else display_location
+            
+            parts = [
+                f"📊 **Status:** {status_icon} {status_text}",
+                f"📍 **Current Location:** {short_location}"
+            ]
+            
+            # Add stop duration if driver is stopped
+            if stop_info and speed_value == 0:
+                stop_duration = time.monotonic() - stop_info['stopped_since']
+                stop_minutes = int(stop_duration // 60)
+                if stop_minutes > 0:
+                    parts.append(f"⏱️ **Stopped for:** {stop_minutes} minute(s)")
+            
+            # Update the status message with the result
+            await status_message.edit_text("\n".join(parts), parse_mode='Markdown')
+            
+        except Exception as e:
+            logger.error(f"Error in location_command: {e}")
+            status_message = await status_task
+            await status_message.edit_text("❌ Error fetching driver data. Please try again later.")
+    
+    async def distance_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /distance command"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        # Check if destination address is provided
+        if not context.args:
+            await update.message.reply_text("📍 Please provide a destination address.\n\n**Example:** `/distance 123 Main St, New York, NY`")
+            return
+        
+        destination = ' '.join(context.args)
+        logger.info(f"Distance command requested: {destination}")
+        
+        # Send processing message concurrently with the fetch below
+        status_task = asyncio.create_task(
+            update.message.reply_text("🔄 Calculating distance...")
+        )
+        
+        try:
+            ctx = await self._fetch_driver_context(chat_id, status_task)
+            if ctx is None:
+                return
+            eld_url, driver_data, speed_value, stop_info = ctx
+            status_message = await status_task
+
+            current_location = driver_data['location']
+            logger.info(f"Driver current location: {current_location}")
+            
+            if _is_offline_location(current_location):
+                await status_message.edit_text("❌ Driver is currently offline - location not available.")
+                return
+            
+            # Calculate distance and time
+            distance_data = await self.calculate_distance_and_time(current_location, destination, chat_id, current_location)
+            
+            if distance_data is None:
+                error_msg = "❌ Error calculating distance. Please check the addresses and try again.\n\n⚠️ Using OpenStreetMap geocoding service. Some addresses may not be found. Try a simpler address format."
+                await status_message.edit_text(error_msg)
+                return
+            
+            # Determine status text based on speed
+            status_text = "Driving" if speed_value > 0 else "Stopped"
+            
+            parts = [
+                f"Status: {status_text}",
+                f"Miles left: {distance_data['distance_text']}",
+                f"ETA: {distance_data['duration_text']}"
+            ]
+            
+            # Add stop duration if driver is stopped
+            if stop_info and speed_value == 0:
+                stop_duration = time.monotonic() - stop_info['stopped_since']
+                stop_minutes = int(stop_duration // 60)
+                if stop_minutes > 0:
+                    parts.append(f"Stopped for: {stop_minutes} minute(s)")
+            
+            # Add warning if using fallback method
+            if "straight-line" in distance_data['method'].lower():
+                parts.append("\nNote: This is straight-line distance, not driving distance. Actual driving distance may be longer.")
+            
+            response = "\n".join(parts)
+            
+            # Store destination (and its coordinates) for automatic updates
+            await self._set_group_destination(chat_id, destination)
+            
+            # Start individual auto-update timer for this group if not already running
+            await self.start_group_auto_update(chat_id)
+            
+            await status_message.edit_text(response)
+            
+        except Exception as e:
+            logger.error(f"Error in distance_command: {e}")
+            status_message = await status_task
+            await status_message.edit_text("❌ Error calculating distance. Please try again later.")
+    async def handle_text_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle text messages for driver management and address calculation"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            return
+        
+        text = update.message.text.strip()
+        logger.info(f"Text message received: {text}")
+        
+        # Handle driver removal confirmation
+        if 'driver_to_remove' in context.user_data:
+            if text.upper() == 'YES':
+                driver_name = context.user_data['driver_to_remove']
+                success, message = self.remove_driver(driver_name)
+                
+                if success:
+                    await update.message.reply_text(
+                        f"✅ **Driver Removed Successfully!**\n\n"
+                        f"{message}\n\n"
+                        f"💡 Use `/drivers` to see remaining drivers."
+                    )
+                else:
+                    await update.message.reply_text(
+                        f"❌ **Failed to remove driver!**\n\n"
+                        f"Error: {message}"
+                    )
+            else:
+                await update.message.reply_text("❌ Driver removal cancelled.")
+            
+            # Clear the context
+            del context.user_data['driver_to_remove']
+            return
+        
+        # Handle driver editing
+        if 'driver_to_edit' in context.user_data:
+            driver_name = context.user_data['driver_to_edit']
+            
+            # Parse edit command: "field value"
+            parts = text.split(' ', 1)
+            if len(parts) < 2:
+                await update.message.reply_text(
+                    "❌ Invalid format!\n\n"
+                    "Please use: `field value`\n\n"
+                    "**Examples:**\n"
+                    "• `name John Smith`\n"
+                    "• `unit 777`\n"
+                    "• `url https://state-eld.us/shared-driver-link/xxxxx`"
+                )
+                return
+            
+            field, value = parts[0].lower(), parts[1]
+            
+            # Validate field
+            if field not in ['name', 'unit', 'url']:
+                await update.message.reply_text(
+                    "❌ Invalid field!\n\n"
+                    "Valid fields: **name**, **unit**, **url**\n\n"
+                    "**Examples:**\n"
+                    "• `name John Smith`\n"
+                    "• `unit 777`\n"
+                    "• `url https://state-eld.us/shared-driver-link/xxxxx`"
+                )
+                return
+            
+            # Map field names
+            field_map = {'name': 'name', 'unit': 'unit_number', 'url': 'eld_url'}
+            actual_field = field_map[field]
+            
+            success, message = self.edit_driver(driver_name, actual_field, value)
+            
+            if success:
+                await update.message.reply_text(
+                    f"✅ **Driver Updated Successfully!**\n\n"
+                    f"{message}\n\n"
+                    f"💡 Use `/driverinfo {driver_name}` to see updated info."
+                )
+            else:
+                await update.message.reply_text(
+                    f"❌ **Failed to update driver!**\n\n"
+                    f"Error: {message}"
+                )
+            
+            # Clear the context
+            del context.user_data['driver_to_edit']
+            return
+        
+        # Check if it looks like an address (contains numbers and letters)
+        if _ADDRESS_LIKE_RE.search(text) and len(text) > 10:
+            # Send processing message concurrently with the fetch below
+            status_task = asyncio.create_task(
+                update.message.reply_text("🔄 Calculating distance to this address...")
+            )
+            
+            try:
+                ctx = await self._fetch_driver_context(chat_id, status_task)
+                if ctx is None:
+                    return
+                eld_url, driver_data, speed_value, stop_info = ctx
+                status_message = await status_task
+                current_location = driver_data['location']
+                
+                logger.info(f"Driver current location for text message: {current_location}")
+                
+                if _is_offline_location(current_location):
+                    await status_message.edit_text("❌ Driver is currently offline - location not available.")
+                    return
+                
+                # Calculate distance and time
+                distance_data = await self.calculate_distance_and_time(current_location, text, chat_id, current_location)
+                
+                if distance_data is None:
+                    error_msg = "❌ Could not find coordinates for the address. Please check the address format.\n\n⚠️ Using OpenStreetMap geocoding service. Try a simpler address format (e.g., 'Main St, City, State')."
+                    await status_message.edit_text(error_msg)
+                    return
+                
+                # Determine status text based on speed
+                status_text = "Driving" if speed_value > 0 else "Stopped"
+                
+                parts = [
+                    f"Status: {status_text}",
+                    f"Miles left: {distance_data['distance_text']}",
+                    f"ETA: {distance_data['duration_text']}"
+                ]
+                
+                # Add stop duration if driver is stopped
+                if stop_info and speed_value == 0:
+                    stop_duration = time.monotonic() - stop_info['stopped_since']
+                    stop_minutes = int(stop_duration // 60)
+                    if stop_minutes > 0:
+                        parts.append(f"Stopped for: {stop_minutes} minute(s)")
+                
+                # Add warning if using fallback method
+                if "straight-line" in distance_data['method'].lower():
+                    parts.append("\nNote: This is straight-line distance, not driving distance. Actual driving distance may be longer.")
+                
+                response = "\n".join(parts)
+                
+                # Store destination (and its coordinates) for automatic updates
+                await self._set_group_destination(chat_id, text)
+                
+                # Start individual auto-update timer for this group if not already running
+                await self.start_group_auto_update(chat_id)
+                
+                await status_message.edit_text(response)
+                
+            except Exception as e:
+                logger.error(f"Error in handle_text_message: {e}")
+                status_message = await status_task
+                await status_message.edit_text("❌ Error calculating distance. Please try again later.")
+    
+    async def drivers_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /drivers command - list all available drivers"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        # DEBUG: Log the drivers command request
+        logger.info(f"🚛 Drivers command requested by chat {chat_id}")
+        
+        # DEBUG: Check if drivers_config exists and what's in it
+        logger.info(f"🔍 DEBUG: drivers_config type: {type(self.drivers_config)}")
+        logger.info(f"🔍 DEBUG: drivers_config content: {self.drivers_config}")
+        
+        # Try to reload configuration if it seems to be missing
+        if not self.drivers_config or not self.drivers_config.get('drivers'):
+            logger.warning("🔄 Drivers config seems empty, attempting to reload...")
+            self.drivers_config = self.load_drivers_config()
+            self._rebuild_driver_index()
+            logger.info(f"🔄 Reloaded config: {len(self.drivers_config.get('drivers', []))} drivers")
+        
+        drivers = self.list_available_drivers()
+        
+        # DEBUG: Log the number of drivers loaded
+        logger.info(f"🚛 Found {len(drivers)} drivers in configuration")
+        
+        if not drivers:
+            await update.message.reply_text("❌ No drivers found in configuration.")
+            return
+        
+        response = "🚛 **Available Drivers:**\n\n"
+        
+        for i, driver in enumerate(drivers, 1):
+            status = "✅ Assigned" if driver['assigned_group'] else "⚪ Available"
+            response += f"{i}. **{driver['name']}** (Unit: {driver['unit_number']}) - {status}\n"
+        
+        response += "\n💡 **Tip:** Use `/setdriver [driver_name]` to assign a driver to this group"
+        
+        await update.message.reply_text(response, parse_mode='Markdown')
+    
+    async def setdriver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /setdriver command - assign a driver to this group"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        if not context.args:
+            await update.message.reply_text("📝 Please provide a driver name.\n\n**Example:** `/setdriver Addam Hayder`\n\n**Tip:** Use `/drivers` to see available drivers")
+            return
+        
+        driver_name = ' '.join(context.args)
+        logger.info(f"Setting driver '{driver_name}' for group {chat_id}")
+        
+        success, message = self.set_driver_for_group(chat_id, driver_name)
+        
+        if success:
+            await update.message.reply_text(f"✅ {message}")
+        else:
+            await update.message.reply_text(f"❌ {message}")
+    
+    async def groupinfo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /groupinfo command - show current group configuration"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        driver = self.get_driver_by_chat_id(chat_id)
+        
+        response = f"📊 **Group Information**\n\n"
+        response += f"**Chat ID:** `{chat_id}`\n"
+        
+        if driver:
+            response += f"**Assigned Driver:** {driver['name']}\n"
+            response += f"**Unit Number:** {driver['unit_number']}\n"
+            response += f"**Status:** ✅ Configured"
+        else:
+            response += f"**Assigned Driver:** None\n"
+            response += f"**Status:** ⚪ Not configured\n\n"
+            response += f"💡 **Tip:** Use `/setdriver [driver_name]` to assign a driver to this group"
+        
+        await update.message.reply_text(response, parse_mode='Markdown')
+    
+    # Driver Management Commands
+    
+    async def adddriver_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Start the add driver conversation"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return ConversationHandler.END
+        
+        await update.message.reply_text(
+            "🚛 **Add New Driver**\n\n"
+            "Let's add a new driver to the system.\n\n"
+            "**Step 1/3:** Please enter the driver's full name:\n\n"
+            "*Example: John Smith*\n\n"
+            "Send /cancel to cancel this operation.",
+            parse_mode='Markdown'
+        )
+        
+        return ADD_DRIVER_NAME
+    
+    async def adddriver_name(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle driver name input"""
+        name = update.message.text.strip()
+        
+        if not name or len(name) < 2:
+            await update.message.reply_text(
+                "❌ Please enter a valid driver name (at least 2 characters).\n\n"
+                "Try again or send /cancel to cancel."
+            )
+            return ADD_DRIVER_NAME
+        
+        # Check if driver already exists
+        if name.lower() in self._driver_by_name_lower:
+            await update.message.reply_text(
+                f"❌ Driver '{name}' already exists!\n\n"
+                "Please choose a different name or send /cancel to cancel."
+            )
+            return ADD_DRIVER_NAME
+        
+        # Store the name in context
+        context.user_data['new_driver_name'] = name
+        
+        await update.message.reply_text(
+            f"✅ **Driver Name:** {name}\n\n"
+            "**Step 2/3:** Please enter the unit/truck number:\n\n"
+            "*Example: 001, 777, K1995*\n\n"
+            "Send /cancel to cancel this operation.",
+            parse_mode='Markdown'
+        )
+        
+        return ADD_DRIVER_UNIT
+    
+    async def adddriver_unit(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle unit number input"""
+        unit_number = update.message.text.strip()
+        
+        if not unit_number or len(unit_number) < 1:
+            await update.message.reply_text(
+                "❌ Please enter a valid unit/truck number.\n\n"
+                "Try again or send /cancel to cancel."
+            )
+            return ADD_DRIVER_UNIT
+        
+        # Check if unit number already exists
+        for driver in self.drivers_config.get('drivers', []):
+            if driver['unit_number'].lower() == unit_number.lower():
+                await update.message.reply_text(
+                    f"❌ Unit number '{unit_number}' is already taken!\n\n"
+                    "Please choose a different unit number or send /cancel to cancel."
+                )
+                return ADD_DRIVER_UNIT
+        
+        # Store the unit number in context
+        context.user_data['new_driver_unit'] = unit_number
+        
+        await update.message.reply_text(
+            f"✅ **Driver Name:** {context.user_data['new_driver_name']}\n"
+            f"✅ **Unit Number:** {unit_number}\n\n"
+            "**Step 3/3:** Please enter the ELD shared driver link URL:\n\n"
+            "*The URL should look like:*\n"
+            "`https://state-eld.us/shared-driver-link/xxxxx-xxxxx-xxxxx`\n\n"
+            "Send /cancel to cancel this operation.",
+            parse_mode='Markdown'
+        )
+        
+        return ADD_DRIVER_URL
+    
+    async def adddriver_url(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle ELD URL input and complete driver creation"""
+        eld_url = update.message.text.strip()
+        
+        if not eld_url.startswith('https://state-eld.us/shared-driver-link/'):
+            await update.message.reply_text(
+                "❌ Invalid ELD URL format!\n\n"
+                "The URL must start with:\n"
+                "`https://state-eld.us/shared-driver-link/`\n\n"
+                "Please try again or send /cancel to cancel.",
+                parse_mode='Markdown'
+            )
+            return ADD_DRIVER_URL
+        
+        # Get data from context
+        name = context.user_data['new_driver_name']
+        unit_number = context.user_data['new_driver_unit']
+        
+        # Add the driver
+        success, message = self.add_new_driver(name, unit_number, eld_url)
+        
+        if success:
+            await update.message.reply_text(
+                f"🎉 **Driver Added Successfully!**\n\n"
+                f"**Name:** {name}\n"
+                f"**Unit:** {unit_number}\n"
+                f"**Status:** Ready for assignment\n\n"
+                f"✅ {message}\n\n"
+                f"💡 **Next Steps:**\n"
+                f"• Use `/setdriver {name}` to assign this driver to a group\n"
+                f"• Use `/drivers` to see all drivers",
+                parse_mode='Markdown'
+            )
+        else:
+            await update.message.reply_text(
+                f"❌ **Failed to add driver!**\n\n"
+                f"Error: {message}\n\n"
+                f"Please try again with `/adddriver`"
+            )
+        
+        # Clear context data
+        context.user_data.clear()
+        
+        return ConversationHandler.END
+    
+    async def cancel_conversation(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Cancel any ongoing conversation"""
+        context.user_data.clear()
+        await update.message.reply_text(
+            "❌ **Operation cancelled.**\n\n"
+            "You can start over anytime with the appropriate command."
+        )
+        return ConversationHandler.END
+    
+    async def removedriver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /removedriver command"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        if not context.args:
+            await update.message.reply_text(
+                "❌ Please provide a driver name to remove.\n\n"
+                "**Usage:** `/removedriver [driver_name]`\n\n"
+                "**Example:** `/removedriver John Smith`\n\n"
+                "💡 **Tip:** Use `/drivers` to see all available drivers.",
+                parse_mode='Markdown'
+            )
+            return
+        
+        driver_name = ' '.join(context.args)
+        
+        # Get driver info first
+        driver_info = self.get_driver_info(driver_name)
+        if not driver_info:
+            await update.message.reply_text(
+                f"❌ Driver '{driver_name}' not found!\n\n"
+                "💡 **Tip:** Use `/drivers` to see all available drivers."
+            )
+            return
+        
+        # Show confirmation
+        assigned_status = "🔗 Assigned to a group" if driver_info.get('telegram_group_id') else "⚪ Not assigned"
+        
+        await update.message.reply_text(
+            f"⚠️ **Confirm Driver Removal**\n\n"
+            f"**Name:** {driver_info['name']}\n"
+            f"**Unit:** {driver_info['unit_number']}\n"
+            f"**Status:** {assigned_status}\n\n"
+            f"❗ This action cannot be undone!\n\n"
+            f"Reply with **YES** to confirm removal, or anything else to cancel."
+        )
+        
+        # Store driver name for confirmation
+        context.user_data['driver_to_remove'] = driver_name
+    
+    async def driverinfo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /driverinfo command"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        if not context.args:
+            await update.message.reply_text(
+                "📋 Please provide a driver name to get information.\n\n"
+                "**Usage:** `/driverinfo [driver_name]`\n\n"
+                "**Example:** `/driverinfo John Smith`\n\n"
+                "💡 **Tip:** Use `/drivers` to see all available drivers.",
+                parse_mode='Markdown'
+            )
+            return
+        
+        driver_name = ' '.join(context.args)
+        driver_info = self.get_driver_info(driver_name)
+        
+        if not driver_info:
+            await update.message.reply_text(
+                f"❌ Driver '{driver_name}' not found!\n\n"
+                "💡 **Tip:** Use `/drivers` to see all available drivers."
+            )
+            return
+        
+        # Format driver information
+        assigned_group = driver_info.get('telegram_group_id')
+        if assigned_group:
+            assignment_status = f"🔗 Assigned to group {assigned_group}"
+        else:
+            assignment_status = "⚪ Not assigned to any group"
+        
+        # Mask the ELD URL for security (show only the last part)
+        eld_url = driver_info['eld_url']
+        if '/' in eld_url:
+            masked_url = eld_url.split('/')[-1][:8] + "..." + eld_url.split('/')[-1][-8:]
+        else:
+            masked_url = eld_url[:8] + "..." + eld_url[-8:] if len(eld_url) > 16 else eld_url
+        
+        response = f"""📋 **Driver Information**
+
+**Name:** {driver_info['name']}
+**Unit Number:** {driver_info['unit_number']}
+**ELD Link:** {masked_url}
+**Status:** {assignment_status}
+
+**Available Actions:**
+• `/setdriver {driver_info['name']}` - Assign to this group
+• `/editdriver {driver_info['name']}` - Edit driver info
+• `/removedriver {driver_info['name']}` - Remove driver"""
+        
+        await update.message.reply_text(response, parse_mode='Markdown')
+    
+    async def editdriver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /editdriver command"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        if not context.args:
+            await update.message.reply_text(
+                "🛠️ **Edit Driver**\n\n"
+                "Please provide a driver name to edit.\n\n"
+                "**Usage:** `/editdriver [driver_name]`\n\n"
+                "**Example:** `/editdriver John Smith`\n\n"
+                "💡 **Tip:** Use `/drivers` to see all available drivers.",
+                parse_mode='Markdown'
+            )
+            return
+        
+        driver_name = ' '.join(context.args)
+        driver_info = self.get_driver_info(driver_name)
+        
+        if not driver_info:
+            await update.message.reply_text(
+                f"❌ Driver '{driver_name}' not found!\n\n"
+                "💡 **Tip:** Use `/drivers` to see all available drivers."
+            )
+            return
+        
+        # Show current driver info and edit options
+        assigned_status = "🔗 Assigned" if driver_info.get('telegram_group_id') else "⚪ Not assigned"
+        
+        response = f"""🛠️ **Edit Driver: {driver_info['name']}**
+
+**Current Information:**
+• **Name:** {driver_info['name']}
+• **Unit:** {driver_info['unit_number']}
+• **Status:** {assigned_status}
+
+**What would you like to edit?**
+1️⃣ **Name** - Reply with: `name [new_name]`
+2️⃣ **Unit Number** - Reply with: `unit [new_unit]`
+3️⃣ **ELD URL** - Reply with: `url [new_url]`
+
+**Examples:**
+• `name Mike Johnson`
+• `unit 555`
+• `url https://state-eld.us/shared-driver-link/xxxxx`
+
+Reply with your choice, or send /cancel to cancel."""
+        
+        await update.message.reply_text(response, parse_mode='Markdown')
+        
+        # Store driver name for editing
+        context.user_data['driver_to_edit'] = driver_name
+    
+    async def unknown_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle unknown commands"""
+        user_id = update.effective_user.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        await update.message.reply_text("❓ Unknown command. Use /help to see available commands.")
+    
+    async def set_destination_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /setdestination command - set destination for automatic updates"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        if not context.args:
+            await update.message.reply_text("📍 Please provide a destination address.\n\n**Example:** `/setdestination 123 Main St, New York, NY`")
+            return
+        
+        destination = ' '.join(context.args)
+        await self._set_group_destination(chat_id, destination)
+        
+        # Start individual auto-update timer for this group if not already running
+        await self.start_group_auto_update(chat_id)
+        
+        await update.message.reply_text(f"✅ **Destination set for automatic updates:**\n\n📍 {destination}\n\n🔄 The bot will now send location updates every {self.auto_update_interval//3600} hour(s) with distance remaining to this destination.")
+    
+    async def clear_destination_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /stop command - clear destination for automatic updates"""
+        user_id = update.effective_user.id
+        chat_id = update.effective_chat.id
+        
+        if not self.is_authorized(user_id):
+            await update.message.reply_text(_NOT_AUTHORIZED_MSG)
+            return
+        
+        if chat_id in self.group_destinations:
+            del self.group_destinations[chat_id]
+            self.group_dest_coords.pop(chat_id, None)
+            self._dest_version[chat_id] = self._dest_version.get(chat_id, 0) + 1
+            
+            # Cancel the individual auto-update task for this group
+            await self.stop_group_auto_update(chat_id)
+            
+            await update.message.reply_text("✅ **Automatic updates disabled.**\n\nDestination cleared. The bot will no longer send automatic location updates.")
+        else:
+            await update.message.reply_text("⚠️ No destination is currently set for this group.")
+    
+    
+    async def process_group_update(self, chat_id, destination):
+        """Process update for a single group - designed to run concurrently,
+        bounded so simultaneous ticks can't stampede the scrape pool"""
+        if self._update_sem is None:
+            self._update_sem = asyncio.Semaphore(self.max_concurrent_updates)
+        async with self._update_sem:
+            await self._process_group_update_inner(chat_id, destination)
+
+    async def _process_group_update_inner(self, chat_id, destination):
+        try:
+            # Captured so the send can be dropped if the destination is
+            # replaced or cleared while the fetch below is in flight
+            dest_version = self._dest_version.get(chat_id)
+            logger.info("Processing auto-update for group %s to destination %s", chat_id, destination)
+            
+            # Get driver for this group
+            driver = self.get_driver_by_chat_id(chat_id)
+            if not driver:
+                logger.warning("No driver assigned to group %s, skipping auto-update", chat_id)
+                return
+            
+            # Get ELD URL for this group
+            eld_url = self.get_eld_url_for_group(chat_id)
+            
+            # Extract current driver data, sharing any in-flight scrape of
+            # the same page (groups sharing one driver coalesce here)
+            driver_data = await self._extract_coalesced(eld_url)
+            
+            current_location = driver_data['location']
+            logger.info("Auto-update: Driver current location: %s", current_location)
+            
+            if _is_offline_location(current_location):
+                logger.warning("Driver offline for group %s, skipping auto-update", chat_id)
+                return
+            
+            # Get driver status and evaluate stop state in one pass
+            driver_status, speed_value = self.get_driver_status(driver_data)
+            stop_info, extended_stop, stop_minutes = self.compute_stop_state(eld_url, driver_data)
+            
+            # The alert is folded into the status message below so an
+            # alerting tick costs one Telegram send, not two
+            alert_message = None
+            if extended_stop:
+                alert_message = _EXT_STOP_TMPL.format(
+                    name=driver_data['name'],
+                    minutes=stop_minutes,
+                    location=current_location
+                )
+            
+            # Determine status text based on speed (tuple index, no branch)
+            status_text = ("Stopped", "Driving")[speed_value > 0]
+            
+            # Distance-based update policy layered on the time-based one:
+            # when the driver has barely moved and the status is unchanged
+            # since a recent report, skip the route call and the send. The
+            # geocode below is effectively free - the location string was
+            # geocoded (and cached) on the previous tick.
+            origin_lat, origin_lon = await self.geocode_address(self.sanitize_address(current_location))
+            last = self._last_report.get(chat_id)
+            if (last is not None and not extended_stop
+                    and status_text == last['status']
+                    and time.monotonic() - last['ts'] < 1800
+                    and origin_lat is not None and last['lat'] is not None):
+                moved = self.haversine_distance(origin_lat, origin_lon, last['lat'], last['lon'])
+                if moved is not None and moved['distance_miles'] < 0.25:
+                    logger.info("Driver for group %s moved %.2f mi since last report, skipping update", chat_id, moved['distance_miles'])
+                    return
+            
+            # Calculate distance and time to destination, reusing the
+            # coordinates resolved when the destination was set
+            distance_data = await self.calculate_distance_and_time(
+                current_location, destination, chat_id, current_location,
+                dest_coords=self.group_dest_coords.get(chat_id)
+            )
+            
+            if distance_data is None:
+                logger.error("Failed to calculate distance for group %s", chat_id)
+                return
+            
+            # Assemble the message in one join instead of += reallocation
+            parts = [
+                (alert_message + "\n") if alert_message is not None else None,
+                _UPDATE_TMPL.format(
+                    status=status_text,
+                    miles=distance_data['distance_text'],
+                    eta=distance_data['duration_text']
+                )
+            ]
+            
+            # Add stop duration if driver is stopped
+            if stop_info and speed_value == 0:
+                stop_duration = time.monotonic() - stop_info['stopped_since']
+                stop_minutes = int(stop_duration // 60)
+                if stop_minutes > 0:
+                    parts.append(f"Stopped for: {stop_minutes} minute(s)")
+            
+            # Add warning if using fallback method
+            if "straight-line" in distance_data['method'].casefold():
+                parts.append("\nNote: This is straight-line distance, not driving distance. Actual driving distance may be longer.")
+            
+            update_message = "\n".join(p for p in parts if p is not None)
+            
+            # Drop the message if the destination changed mid-tick - an ETA
+            # to a stale destination is worse than no update
+            if (self._dest_version.get(chat_id) != dest_version
+                    or self.group_destinations.get(chat_id) != destination):
+                logger.info("Destination for group %s changed mid-update, dropping stale message", chat_id)
+                return
+            
+            # Send the update message (and any fused alert) in one call
+            await self._send_message(
+                chat_id=chat_id,
+                text=update_message,
+                parse_mode='Markdown' if alert_message is not None else None
+            )
+            if alert_message is not None:
+                # Mark as notified only now that the alert reached the
+                # group; a bail-out above leaves it pending for next tick
+                stop_info['notified'] = True
+                logger.info("Sent extended stop alert to group %s", chat_id)
+            
+            # Adapt the next tick to the motion state: a moving truck needs
+            # tighter ETAs, a parked one barely changes
+            if extended_stop:
+                self._group_next_delay[chat_id] = 3600
+            elif speed_value > 40:
+                self._group_next_delay[chat_id] = 300
+            elif speed_value > 0:
+                self._group_next_delay[chat_id] = 900
+            else:
+                self._group_next_delay[chat_id] = self.auto_update_interval
+            
+            self._last_report[chat_id] = {
+                'lat': origin_lat, 'lon': origin_lon,
+                'status': status_text, 'ts': time.monotonic()
+            }
+            logger.info("Sent auto-update to group %s", chat_id)
+            
+        except Exception as e:
+            logger.error("Error in auto-update for group %s: %s", chat_id, e)
+    
+    async def start_group_auto_update(self, chat_id):
+        """Schedule auto-updates for a group on the shared scheduler"""
+        if self._schedule_wake is None:
+            self._schedule_wake = asyncio.Event()
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+
+        # Pushing a fresh due time supersedes any earlier heap entry for
+        # this chat - stale entries are skipped when popped
+        next_due = time.monotonic() + self.auto_update_interval
+        self._scheduled[chat_id] = next_due
+        heapq.heappush(self._schedule, (next_due, chat_id))
+        self._schedule_wake.set()
+        logger.info("Scheduled auto-updates for group %s", chat_id)
+
+    async def stop_group_auto_update(self, chat_id):
+        """Unschedule auto-updates for a specific group"""
+        if chat_id in self._scheduled:
+            del self._scheduled[chat_id]
+            logger.info("Stopped auto-updates for group %s", chat_id)
+
+    async def _scheduler_loop(self):
+        """Single coroutine driving all group auto-updates off one heap.
+
+        Replaces the previous task-per-group design (N sleeping coroutines
+        and N timer handles): the loop sleeps until the earliest due entry,
+        fires due groups as tasks, and re-arms them."""
+        logger.info("Auto-update scheduler started")
+        while True:
+            try:
+                now = time.monotonic()
+                while self._schedule and self._schedule[0][0] <= now:
+                    due, chat_id = heapq.heappop(self._schedule)
+                    if self._scheduled.get(chat_id) != due:
+                        # Superseded or unscheduled entry
+                        continue
+                    destination = self.group_destinations.get(chat_id)
+                    if destination is None:
+                        logger.info("No destination set for group %s, stopping auto-update", chat_id)
+                        del self._scheduled[chat_id]
+                        continue
+                    logger.info("Running auto-update for group %s to destination %s", chat_id, destination)
+                    task = asyncio.create_task(self.process_group_update(chat_id, destination))
+                    self._update_tasks.add(task)
+                    task.add_done_callback(self._update_tasks.discard)
+                    next_due = now + self._group_next_delay.get(chat_id, self.auto_update_interval)
+                    self._scheduled[chat_id] = next_due
+                    heapq.heappush(self._schedule, (next_due, chat_id))
+
+                timeout = self._schedule[0][0] - now if self._schedule else None
+                self._schedule_wake.clear()
+                try:
+                    await asyncio.wait_for(self._schedule_wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                logger.info("Auto-update scheduler cancelled")
+                break
+            except Exception as e:
+                logger.error("Error in auto-update scheduler: %s", e)
+                await asyncio.sleep(1)
+
+    def run(self):
+        """Start the bot"""
+        try:
+            # Create application
+            application = Application.builder().token(self.bot_token).build()
+            
+            # Store application reference for auto-updates, and pre-resolve
+            # the send binding used on every tick
+            self.application = application
+            self._send_message = application.bot.send_message
+            
+            # Add conversation handler for adding drivers
+            add_driver_handler = ConversationHandler(
+                entry_points=[CommandHandler('adddriver', self.adddriver_start)],
+                states={
+                    ADD_DRIVER_NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.adddriver_name)],
+                    ADD_DRIVER_UNIT: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.adddriver_unit)],
+                    ADD_DRIVER_URL: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.adddriver_url)],
+                },
+                fallbacks=[CommandHandler('cancel', self.cancel_conversation)]
+            )
+            
+            # Add handlers
+            application.add_handler(CommandHandler("start", self.start_command))
+            application.add_handler(CommandHandler("help", self.help_command))
+            application.add_handler(CommandHandler("location", self.location_command))
+            application.add_handler(CommandHandler("distance", self.distance_command))
+            application.add_handler(CommandHandler("drivers", self.drivers_command))
+            application.add_handler(CommandHandler("setdriver", self.setdriver_command))
+            application.add_handler(CommandHandler("groupinfo", self.groupinfo_command))
+            application.add_handler(CommandHandler("setdestination", self.set_destination_command))
+            application.add_handler(CommandHandler("stop", self.clear_destination_command))
+            
+            # Add driver management handlers
+            application.add_handler(add_driver_handler)
+            application.add_handler(CommandHandler("editdriver", self.editdriver_command))
+            application.add_handler(CommandHandler("removedriver", self.removedriver_command))
+            application.add_handler(CommandHandler("driverinfo", self.driverinfo_command))
+            
+            # Add text message handler for address detection
+            application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text_message))
+            
+            # Add error handler
+            async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+                logger.error(f"Exception while handling an update: {context.error}")
+            
+            application.add_error_handler(error_handler)
+            
+            # No global auto-update task needed - individual group timers are started when needed
+            async def post_init(application):
+                """Initialize application after start"""
+                logger.info("Bot initialized - individual group auto-update timers will start when distance commands are used")
+            
+            application.post_init = post_init
+            
+            # Start the bot
+            logger.info("Starting bot...")
+            try:
+                application.run_polling(allowed_updates=Update.ALL_TYPES)
+            finally:
+                # Flush any pending config changes before tearing down
+                if self._config_dirty.is_set():
+                    self._write_drivers_config()
+                self.shutdown_driver_pool()
+            
+        except Exception as e:
+            logger.error(f"Error starting bot: {e}")
+            raise
+
+def main():
+    """Main function"""
+    try:
+        bot = LocationBot()
+        bot.run()
+    except Exception as e:
+        logger.error(f"Fatal error: {e}")
+        print(f"❌ Error: {e}")
+
+if __name__ == "__main__":
+    main()